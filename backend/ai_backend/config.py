@@ -4,13 +4,16 @@ Provides unified LangChain settings for planner and chatbot modules
 """
 
 import os
+import asyncio
 import logging
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, List
 
 from langchain_openai import ChatOpenAI
 from langchain.schema import BaseMessage, HumanMessage, SystemMessage, AIMessage
 from langchain.callbacks.base import BaseCallbackHandler
 from langchain.schema.runnable import RunnableConfig
+from langchain.schema.output import Generation
+from langchain.output_parsers import PydanticOutputParser
 from core.config import settings
 
 logger = logging.getLogger(__name__)
@@ -47,6 +50,20 @@ class InterviewCallbackHandler(BaseCallbackHandler):
         """Callback when LLM call errors"""
         logger.error(f"[{self.session_id}] LLM error: {error}")
 
+class ExecutorPydanticOutputParser(PydanticOutputParser):
+    """
+    Pydantic output parser whose async path runs validation in the default thread pool
+    Keeps JSON decoding and model validation off the event loop under concurrent sessions
+    """
+    
+    async def aparse(self, text: str) -> Any:
+        return await asyncio.get_running_loop().run_in_executor(None, self.parse, text)
+    
+    async def aparse_result(self, result: List[Generation], *, partial: bool = False) -> Any:
+        return await asyncio.get_running_loop().run_in_executor(
+            None, lambda: self.parse_result(result, partial=partial)
+        )
+
 class LangChainManager:
     """LangChain manager providing unified LLM configuration and tools"""
     
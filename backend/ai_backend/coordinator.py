@@ -1,6 +1,6 @@
 import asyncio
 import logging
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, BinaryIO, Union
 from datetime import datetime
 from pathlib import Path
 import os
@@ -40,7 +40,7 @@ class AICoordinator:
         self.active_tasks = {}
         
         # Supported audio formats
-        self.supported_audio_formats = settings.SUPPORTED_AUDIO_FORMATS
+        self.supported_audio_formats = sorted(settings.SUPPORTED_AUDIO_FORMATS)
         
         logger.info("AI Coordinator initialized with optimized modules and concurrent processing")
         logger.info(f"Test data path set to: {self.test_data_path}")
@@ -49,6 +49,14 @@ class AICoordinator:
         # Interview status tracking
         self.interview_states = {}  # session_id -> {current_question_index, followup_count, questions}
     
+    async def warmup(self):
+        """Warm up external API connections before serving traffic"""
+        await self.speech_recognizer.warmup()
+    
+    async def close(self):
+        """Release external API connections"""
+        await self.speech_recognizer.close()
+    
     async def health_check(self) -> Dict[str, Any]:
         """
         Perform health check on all AI modules
@@ -121,17 +129,19 @@ class AICoordinator:
     
     async def transcribe_audio(
         self,
-        audio_content: bytes,
+        audio_content: Union[bytes, BinaryIO],
         audio_format: str,
-        session_id: str
+        session_id: str,
+        cache: bool = True
     ) -> Dict[str, Any]:
         """
         Transcribe audio content (for API Gateway compatibility)
         
         Args:
-            audio_content: Audio file content as bytes
+            audio_content: Audio file content as bytes, or a binary file object streamed to the recognizer
             audio_format: Audio file format
             session_id: Session ID for logging
+            cache: Use the recognizer's transcription cache (partial transcripts skip it)
             
         Returns:
             Dict: Transcription result with success status and transcription text
@@ -143,7 +153,8 @@ class AICoordinator:
             result = await self.speech_recognizer.transcribe_audio(
                 audio_content=audio_content,
                 audio_format=audio_format,
-                session_id=session_id
+                session_id=session_id,
+                cache=cache
             )
             
             processing_time = (datetime.now() - start_time).total_seconds()
@@ -170,7 +181,7 @@ class AICoordinator:
     
     async def transcribe_audio_direct(
         self,
-        audio_content: bytes,
+        audio_content: Union[bytes, BinaryIO],
         file_format: str,
         session_id: str
     ) -> Dict[str, Any]:
@@ -178,7 +189,7 @@ class AICoordinator:
         Direct audio transcription method (for process_unified_input compatibility)
         
         Args:
-            audio_content: Audio file content as bytes
+            audio_content: Audio file content as bytes, or a binary file object streamed to the recognizer
             file_format: Audio file format (e.g., 'webm', 'mp3', 'wav')
             session_id: Session ID for logging
             
@@ -266,7 +277,8 @@ class AICoordinator:
                 user_answer=user_text,
                 original_question=current_question.get("question", ""),
                 context=input_data.get("context", ""),
-                session_id=session_id
+                session_id=session_id,
+                is_followup=state["followup_count"] > 0
             )
             
             # 3. Decide whether to follow up (based on loop control, max 1 time)
@@ -325,13 +337,13 @@ class AICoordinator:
                 "error": str(e)
             }
     
-    def reset_interview_session(self, session_id: str):
+    async def reset_interview_session(self, session_id: str):
         """Reset interview session state including planner conversation memory"""
         if session_id in self.interview_states:
             del self.interview_states[session_id]
         
         # Also reset planner conversation memory
-        self.planner.reset_session(session_id)
+        await self.planner.reset_session(session_id)
         
         logger.info(f"[{session_id}] Interview session state and conversation memory reset")
     
@@ -343,7 +355,7 @@ class AICoordinator:
         else:
             logger.warning(f"[{session_id}] No interview state found for followup reset")
     
-    def get_interview_status(self, session_id: str) -> Dict[str, Any]:
+    async def get_interview_status(self, session_id: str) -> Dict[str, Any]:
         """Get interview status"""
         if session_id not in self.interview_states:
             return {"exists": False, "message": "No interview session found"}
@@ -355,12 +367,12 @@ class AICoordinator:
             "followup_count": state["followup_count"],
             "total_questions": len(state["questions"]),
             "progress": f"{state['current_question_index']}/{len(state['questions'])}",
-            "conversation_count": len(self.planner.get_conversation_memory(session_id))
+            "conversation_count": len(await self.planner.get_conversation_memory(session_id))
         }
     
-    def get_conversation_history(self, session_id: str) -> List[Dict]:
+    async def get_conversation_history(self, session_id: str) -> List[Dict]:
         """Get complete conversation history"""
-        return self.planner.get_conversation_memory(session_id)
+        return await self.planner.get_conversation_memory(session_id)
     
     def _save_report_to_file(self, report_data: Dict[str, Any], candidate_name: str, session_id: str) -> Dict[str, str]:
         """
@@ -579,8 +591,8 @@ class AICoordinator:
                 "session_id": session_id
             }
             
-            # Save report to files
-            file_paths = self._save_report_to_file(report_data, candidate_name, session_id)
+            # Save report to files (blocking disk I/O, keep it off the event loop)
+            file_paths = await asyncio.to_thread(self._save_report_to_file, report_data, candidate_name, session_id)
             
             # Add file paths to response
             report_data.update({
@@ -618,7 +630,7 @@ class AICoordinator:
         Args:
             input_data: Input data, can contain:
                 - text: direct text input
-                - audio_content: audio file content (bytes)
+                - audio_content: audio file content (bytes or binary file object)
                 - audio_format: audio file format
                 - context: conversation context
                 - original_question: original question
@@ -708,7 +720,8 @@ class AICoordinator:
                     user_answer=user_text,
                     original_question=current_question_text,
                     context=input_data.get("context", ""),
-                    session_id=session_id
+                    session_id=session_id,
+                    is_followup=state["followup_count"] > 0
                 ),
                 timeout=settings.FOLLOWUP_TIMEOUT
             )
@@ -829,4 +842,4 @@ class AICoordinator:
                 "current_question_index": 0,
                 "total_questions": 3,
                 "interview_completed": False
-            }
\ No newline at end of file
+            }
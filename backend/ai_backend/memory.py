@@ -0,0 +1,120 @@
+"""
+Conversation memory storage for AI backend modules
+Provides a bounded in-process store and a Redis-backed store shared across workers
+"""
+
+import json
+import logging
+import time
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Tuple
+
+from core.config import settings
+
+try:
+    import redis.asyncio as aioredis
+except ImportError:  # Redis backend is optional
+    aioredis = None
+
+logger = logging.getLogger(__name__)
+
+class InMemoryConversationMemory:
+    """
+    Process-local conversation memory
+    Bounded by session count (LRU eviction) and per-session TTL
+    """
+
+    def __init__(self, max_sessions: int = 1000, ttl_seconds: int = 3600):
+        self.max_sessions = max_sessions
+        self.ttl_seconds = ttl_seconds
+        # session_id -> (expires_at, turns)
+        self._sessions: "OrderedDict[str, Tuple[float, List[Dict[str, Any]]]]" = OrderedDict()
+
+    def _get_live(self, session_id: str) -> Optional[List[Dict[str, Any]]]:
+        """Return turns for a non-expired session, dropping it if expired"""
+        item = self._sessions.get(session_id)
+        if item is None:
+            return None
+        expires_at, turns = item
+        if expires_at < time.monotonic():
+            del self._sessions[session_id]
+            return None
+        return turns
+
+    async def append(self, session_id: str, entry: Dict[str, Any]) -> int:
+        """Append a conversation turn, refresh TTL and return the turn count"""
+        turns = self._get_live(session_id)
+        if turns is None:
+            turns = []
+        turns.append(entry)
+        self._sessions[session_id] = (time.monotonic() + self.ttl_seconds, turns)
+        self._sessions.move_to_end(session_id)
+
+        # Evict least recently used sessions
+        while len(self._sessions) > self.max_sessions:
+            evicted_id, _ = self._sessions.popitem(last=False)
+            logger.debug(f"[{evicted_id}] Conversation memory evicted (LRU)")
+
+        return len(turns)
+
+    async def get(self, session_id: str) -> List[Dict[str, Any]]:
+        """Get all conversation turns for a session"""
+        turns = self._get_live(session_id)
+        if turns is None:
+            return []
+        self._sessions.move_to_end(session_id)
+        return list(turns)
+
+    async def delete(self, session_id: str):
+        """Delete session conversation memory"""
+        self._sessions.pop(session_id, None)
+
+class RedisConversationMemory:
+    """
+    Redis-backed conversation memory
+    Each session is a list `session:{id}:turns` with a sliding TTL; eviction is left to Redis maxmemory policy
+    """
+
+    def __init__(self, url: str, ttl_seconds: int = 3600):
+        if aioredis is None:
+            raise ImportError("redis package is required for RedisConversationMemory")
+        self.redis = aioredis.Redis.from_url(url, decode_responses=True)
+        self.ttl_seconds = ttl_seconds
+
+    @staticmethod
+    def _key(session_id: str) -> str:
+        return f"session:{session_id}:turns"
+
+    async def append(self, session_id: str, entry: Dict[str, Any]) -> int:
+        """Append a conversation turn, refresh TTL and return the turn count"""
+        key = self._key(session_id)
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.rpush(key, json.dumps(entry, default=str))
+            pipe.expire(key, self.ttl_seconds)
+            count, _ = await pipe.execute()
+        return count
+
+    async def get(self, session_id: str) -> List[Dict[str, Any]]:
+        """Get all conversation turns for a session"""
+        raw_turns = await self.redis.lrange(self._key(session_id), 0, -1)
+        return [json.loads(turn) for turn in raw_turns]
+
+    async def delete(self, session_id: str):
+        """Delete session conversation memory"""
+        await self.redis.delete(self._key(session_id))
+
+def create_conversation_memory():
+    """Create conversation memory backend based on configuration"""
+    if settings.REDIS_URL:
+        try:
+            memory = RedisConversationMemory(settings.REDIS_URL, ttl_seconds=settings.SESSION_MEMORY_TTL)
+            logger.info("Conversation memory backend: Redis")
+            return memory
+        except ImportError as e:
+            logger.warning(f"Redis conversation memory unavailable, falling back to in-process store: {e}")
+
+    logger.info("Conversation memory backend: in-process LRU")
+    return InMemoryConversationMemory(
+        max_sessions=settings.SESSION_MEMORY_MAX_SESSIONS,
+        ttl_seconds=settings.SESSION_MEMORY_TTL
+    )
@@ -4,21 +4,29 @@ Responsible for deciding whether to continue follow-up (maximum 1) or move to ne
 """
 
 import logging
-from typing import Dict, Any, List
+from collections import OrderedDict
+from difflib import SequenceMatcher
+from typing import Dict, Any, List, Optional
 from datetime import datetime
 from pydantic import BaseModel, Field
 
 from langchain.prompts import ChatPromptTemplate
-from langchain.output_parsers import PydanticOutputParser, OutputFixingParser
-from langchain.schema.runnable import RunnablePassthrough
+from langchain.output_parsers import OutputFixingParser
 
 from ..config import (
     langchain_manager, 
     get_system_message, 
-    create_runnable_config
+    create_runnable_config,
+    ExecutorPydanticOutputParser
 )
+from ..memory import create_conversation_memory
 from core.config import settings
 
+try:
+    from rapidfuzz import fuzz
+except ImportError:  # rapidfuzz is optional, fall back to difflib
+    fuzz = None
+
 logger = logging.getLogger(__name__)
 
 class SkillAssessment(BaseModel):
@@ -59,6 +67,19 @@ class InterviewReport(BaseModel):
     followup_questions: int = Field(description="Number of follow-up questions")
     response_quality_avg: float = Field(description="Average answer quality score")
 
+class ReportGenerationResult(BaseModel):
+    """LLM output model for report generation"""
+    overall_score: int = Field(ge=1, le=10, description="Overall score")
+    overall_summary: str = Field(description="Overall evaluation")
+    skill_assessments: List[SkillAssessment] = Field(description="Skills assessment")
+    strengths: List[str] = Field(description="Strengths")
+    areas_for_improvement: List[str] = Field(description="Areas for improvement")
+    behavioral_insights: List[str] = Field(description="Behavioral insights")
+    question_performance: List[Dict[str, Any]] = Field(description="Question performance")
+    hiring_recommendation: str = Field(description="Hiring recommendation")
+    next_steps: List[str] = Field(description="Next steps")
+    response_quality_avg: float = Field(description="Average answer quality")
+
 class AnalysisResult(BaseModel):
     """Answer quality analysis result model"""
     # Analysis section
@@ -75,6 +96,20 @@ class AnalysisResult(BaseModel):
     suggested_focus: str = Field(description="Recommended focus direction")
     conversation_context: str = Field(description="Conversation context summary")
 
+# Heuristic gate thresholds - answers matching these are scored without an LLM call
+MIN_ANSWER_WORDS = 5
+DUPLICATE_ANSWER_RATIO = 92
+# difflib is O(n*m) pure Python on the event loop - longer answers skip the duplicate check without rapidfuzz
+DIFFLIB_MAX_CHARS = 1000
+
+def _similarity(a: str, b: str) -> float:
+    """Similarity ratio 0-100 between two answers"""
+    if fuzz is not None:
+        return fuzz.ratio(a, b)
+    if len(a) > DIFFLIB_MAX_CHARS or len(b) > DIFFLIB_MAX_CHARS:
+        return 0.0
+    return SequenceMatcher(None, a, b).ratio() * 100
+
 class SimplifiedInterviewPlanner:
     """
     Simplified interview planner module
@@ -84,31 +119,37 @@ class SimplifiedInterviewPlanner:
     def __init__(self):
         self.llm = langchain_manager.get_analysis_llm()
         
-        # Create output parser
-        self.parser = PydanticOutputParser(pydantic_object=AnalysisResult)
+        # Create output parser (validation runs in thread pool, off the event loop)
+        self.parser = ExecutorPydanticOutputParser(pydantic_object=AnalysisResult)
         self.fixing_parser = OutputFixingParser.from_llm(parser=self.parser, llm=self.llm)
         
+        # Format instructions are static per schema - build once instead of per chain call
+        self._analysis_format_instructions = self.parser.get_format_instructions()
+        
         # Create analysis chain
         self.analysis_chain = self._create_analysis_chain()
         
+        # Create report chain once - model, parser and chain are reused across sessions
+        self._report_parser = ExecutorPydanticOutputParser(pydantic_object=ReportGenerationResult)
+        self._report_fixing_parser = OutputFixingParser.from_llm(parser=self._report_parser, llm=self.llm)
+        self._report_chain = self._create_report_generation_chain()
+        
         # conversation memory storage - uncompressed, save complete conversation
-        self.conversation_memories: Dict[str, List[Dict]] = {}  # session_id -> conversation history
+        # In-process LRU by default, Redis when REDIS_URL is configured (shared across workers)
+        self.memory = create_conversation_memory()
+        
+        # Last (question, answer, analysis) per session for the near-duplicate fast path
+        self._last_analysis: "OrderedDict[str, tuple]" = OrderedDict()
         
         logger.info("Simplified Interview Planner initialized with conversation memory")
     
     def _create_analysis_chain(self):
         """Create answer quality analysis chain"""
         
+        # Static instructions first, then the append-only history, then this turn's fields -
+        # consecutive calls share the longest possible prompt prefix (provider prompt caching)
         analysis_template = """You are a professional interview analyst. Please analyze the quality of the candidate's Answer based on the complete conversation history.
 
-**Current Question**: {original_question}
-**Candidate Answer**: {user_answer}
-
-**Complete Conversation History**:
-{conversation_history}
-
-**Additional Context**: {context}
-
 Please conduct a deep quality analysis considering the conversation history:
 
 1. **Answer Quality Assessment**:
@@ -130,21 +171,22 @@ Please conduct a deep quality analysis considering the conversation history:
 
 {format_instructions}
 
+**Complete Conversation History**:
+{conversation_history}
+
+**Current Question**: {original_question}
+**Candidate Answer**: {user_answer}
+
+**Additional Context**: {context}
+
 Please return the analysis results in JSON format."""
 
         prompt = ChatPromptTemplate.from_messages([
             get_system_message("interview_planner"),
             ("human", analysis_template)
-        ])
+        ]).partial(format_instructions=self._analysis_format_instructions)
         
-        chain = (
-            RunnablePassthrough.assign(
-                format_instructions=lambda _: self.parser.get_format_instructions()
-            )
-            | prompt
-            | self.llm
-            | self.fixing_parser
-        )
+        chain = prompt | self.llm | self.fixing_parser
         
         return chain
     
@@ -153,34 +195,42 @@ Please return the analysis results in JSON format."""
         user_answer: str,
         original_question: str,
         context: str = "",
-        session_id: str = "unknown"
+        session_id: str = "unknown",
+        is_followup: bool = False
     ) -> Dict[str, Any]:
         """
         Analyze user answer quality using complete conversation history
+        is_followup marks answers given to a follow-up question (counted in the report)
         """
         try:
             logger.info(f"[{session_id}] Analyzing answer quality with conversation history")
             
             # Record current conversation to memory
-            self._add_to_memory(session_id, {
+            await self._add_to_memory(session_id, {
                 "question": original_question,
                 "answer": user_answer,
                 "timestamp": logger.name  # Simple marker, can use datetime
-            })
+            }, is_followup=is_followup)
             
             # Get complete conversation history
-            conversation_history = self._get_conversation_context(session_id)
+            conversation_history = await self._get_conversation_context(session_id)
             
-            # Use AI for quality analysis including conversation history
-            input_data = {
-                "user_answer": user_answer,
-                "original_question": original_question,
-                "conversation_history": conversation_history,
-                "context": context or "No previous conversation"
-            }
+            # Cheap heuristic gate - skip the LLM call when the outcome is obvious
+            analysis_result = self._heuristic_analysis(user_answer, original_question, session_id)
+            
+            if analysis_result is None:
+                # Use AI for quality analysis including conversation history
+                input_data = {
+                    "user_answer": user_answer,
+                    "original_question": original_question,
+                    "conversation_history": conversation_history,
+                    "context": context or "No previous conversation"
+                }
+                
+                config = create_runnable_config(session_id, task="answer_analysis")
+                analysis_result = await self.analysis_chain.ainvoke(input_data, config=config)
             
-            config = create_runnable_config(session_id, task="answer_analysis")
-            analysis_result = await self.analysis_chain.ainvoke(input_data, config=config)
+            self._remember_analysis(session_id, original_question, user_answer, analysis_result)
             
             # Return analysis results
             return {
@@ -215,21 +265,56 @@ Please return the analysis results in JSON format."""
                 "reasoning": "System error, unable to analyze"
             }
     
-    def _add_to_memory(self, session_id: str, conversation_entry: Dict[str, str]):
-        """Add conversation record to memory"""
-        if session_id not in self.conversation_memories:
-            self.conversation_memories[session_id] = []
+    def _heuristic_analysis(self, user_answer: str, original_question: str, session_id: str) -> Optional[AnalysisResult]:
+        """
+        Rule-based fast path for answers that don't need an LLM to score
+        Returns None when the answer should go through the analysis chain
+        """
+        if len(user_answer.split()) < MIN_ANSWER_WORDS:
+            logger.info(f"[{session_id}] Answer too short, skipping LLM analysis")
+            return AnalysisResult(
+                completeness_score=2,
+                specificity_score=1,
+                key_themes=[],
+                missing_elements=["concrete example"],
+                needs_followup=True,
+                reasoning="Answer is too short to address the question",
+                suggested_focus="ask for concrete example",
+                conversation_context="Candidate gave a very brief answer"
+            )
+        
+        # Only a repeat answer to the same question may reuse its analysis
+        previous = self._last_analysis.get(session_id)
+        if previous is not None:
+            last_question, last_answer, last_result = previous
+            if last_question == original_question and _similarity(user_answer, last_answer) > DUPLICATE_ANSWER_RATIO:
+                logger.info(f"[{session_id}] Answer near-identical to previous one, reusing analysis")
+                return last_result
         
-        self.conversation_memories[session_id].append(conversation_entry)
-        logger.debug(f"[{session_id}] Added conversation to memory, total: {len(self.conversation_memories[session_id])}")
+        return None
+    
+    def _remember_analysis(self, session_id: str, original_question: str, user_answer: str, analysis_result: AnalysisResult):
+        """Keep the latest analysis per session, bounded like conversation memory"""
+        self._last_analysis[session_id] = (original_question, user_answer, analysis_result)
+        self._last_analysis.move_to_end(session_id)
+        while len(self._last_analysis) > settings.SESSION_MEMORY_MAX_SESSIONS:
+            self._last_analysis.popitem(last=False)
+    
+    async def _add_to_memory(self, session_id: str, conversation_entry: Dict[str, Any], is_followup: bool = False):
+        """Add conversation record to memory"""
+        conversation_entry["is_followup"] = is_followup
+        total = await self.memory.append(session_id, conversation_entry)
+        logger.debug(f"[{session_id}] Added conversation to memory, total: {total}")
     
-    def _get_conversation_context(self, session_id: str) -> str:
+    async def _get_conversation_context(self, session_id: str, conversation: List[Dict] = None) -> str:
         """Get complete conversation history in text format"""
-        if session_id not in self.conversation_memories or not self.conversation_memories[session_id]:
+        if conversation is None:
+            conversation = await self.memory.get(session_id)
+        if not conversation:
             return "No conversation history"
         
         history_parts = []
-        for i, entry in enumerate(self.conversation_memories[session_id], 1):
+        for i, entry in enumerate(conversation, 1):
             history_parts.append(f"Conversation round {i}:")
             history_parts.append(f"Question: {entry['question']}")
             history_parts.append(f"Answer: {entry['answer']}")
@@ -237,14 +322,14 @@ Please return the analysis results in JSON format."""
         
         return "\n".join(history_parts)
     
-    def get_conversation_memory(self, session_id: str) -> List[Dict]:
+    async def get_conversation_memory(self, session_id: str) -> List[Dict]:
         """Get original conversation records"""
-        return self.conversation_memories.get(session_id, [])
+        return await self.memory.get(session_id)
     
-    def reset_session(self, session_id: str):
+    async def reset_session(self, session_id: str):
         """Reset session state, clear conversation memory"""
-        if session_id in self.conversation_memories:
-            del self.conversation_memories[session_id]
+        await self.memory.delete(session_id)
+        self._last_analysis.pop(session_id, None)
         logger.info(f"[{session_id}] Session state and conversation memory reset")
     
     async def generate_interview_report(
@@ -268,14 +353,11 @@ Please return the analysis results in JSON format."""
             logger.info(f"[{session_id}] Generating comprehensive interview report")
             
             # Get complete conversation history
-            conversation_history = self.get_conversation_memory(session_id)
+            conversation_history = await self.get_conversation_memory(session_id)
             if not conversation_history:
                 raise ValueError("No conversation history found for this session")
             # Prepare analysis data
-            full_conversation = self._get_conversation_context(session_id)
-            
-            # Create report generation chain
-            report_chain = self._create_report_generation_chain()
+            full_conversation = await self._get_conversation_context(session_id, conversation_history)
             
             # Prepare input data
             input_data = {
@@ -287,11 +369,11 @@ Please return the analysis results in JSON format."""
             
             # Generate report
             config = create_runnable_config(session_id, task="report_generation")
-            report_result = await report_chain.ainvoke(input_data, config=config)
+            report_result = await self._report_chain.ainvoke(input_data, config=config)
             
             # Calculate statistics
             total_questions = len(conversation_history)
-            followup_count = sum(1 for entry in conversation_history if "followup" in str(entry).lower())
+            followup_count = sum(1 for entry in conversation_history if entry.get("is_followup", False))
             
             # Build final report
             report = InterviewReport(
@@ -335,7 +417,7 @@ Please return the analysis results in JSON format."""
                 question_performance=[],
                 hiring_recommendation="neutral",
                 next_steps=["Conduct manual review", "Consider re-interview if needed"],
-                total_questions=len(self.get_conversation_memory(session_id)),
+                total_questions=len(await self.get_conversation_memory(session_id)),
                 followup_questions=0,
                 response_quality_avg=5.0
             )
@@ -387,37 +469,12 @@ Please ensure analysis is objective and specific, based on actual conversation c
 
 Please return the complete report in JSON format."""
 
-        # Create report result parser
-        from pydantic import BaseModel, Field
-        
-        class ReportGenerationResult(BaseModel):
-            overall_score: int = Field(ge=1, le=10, description="Overall score")
-            overall_summary: str = Field(description="Overall evaluation")
-            skill_assessments: List[SkillAssessment] = Field(description="Skills assessment")
-            strengths: List[str] = Field(description="Strengths")
-            areas_for_improvement: List[str] = Field(description="Areas for improvement")
-            behavioral_insights: List[str] = Field(description="Behavioral insights")
-            question_performance: List[Dict[str, Any]] = Field(description="Question performance")
-            hiring_recommendation: str = Field(description="Hiring recommendation")
-            next_steps: List[str] = Field(description="Next steps")
-            response_quality_avg: float = Field(description="Average answer quality")
-        
-        parser = PydanticOutputParser(pydantic_object=ReportGenerationResult)
-        fixing_parser = OutputFixingParser.from_llm(parser=parser, llm=self.llm)
-        
         prompt = ChatPromptTemplate.from_messages([
             get_system_message("interview_planner"),
             ("human", report_template)
-        ])
+        ]).partial(format_instructions=self._report_parser.get_format_instructions())
         
-        chain = (
-            RunnablePassthrough.assign(
-                format_instructions=lambda _: parser.get_format_instructions()
-            )
-            | prompt
-            | self.llm
-            | fixing_parser
-        )
+        chain = prompt | self.llm | self._report_fixing_parser
         
         return chain
     
@@ -1,13 +1,81 @@
 import openai
+import httpx
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, AsyncIterator, BinaryIO, Tuple, Union
 import asyncio
-from pathlib import Path
+import hashlib
+import io
+import mmap
+import os
+from collections import OrderedDict
 
 from core.config import settings
 
+try:
+    import numpy as np
+except ImportError:  # numpy is optional, pure-Python fallback below
+    np = None
+
+try:
+    from blake3 import blake3 as _audio_hasher
+except ImportError:  # blake3 is optional, blake2b is fast enough as a fallback
+    _audio_hasher = hashlib.blake2b
+
+try:
+    import h2  # noqa: F401 - enables HTTP/2 in httpx
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Files above this size are memory-mapped instead of read through a buffered handle
+MMAP_THRESHOLD = 4 * 1024 * 1024
+
+_ASCII_DIGITS = b"0123456789"
+
+def _audio_digest(file_obj: io.BytesIO) -> str:
+    """Content hash of in-memory audio, read straight from the buffer (no copy, position untouched)"""
+    with file_obj.getbuffer() as view:
+        return _audio_hasher(view).hexdigest()
+
+def _heuristic_confidence(has_digit: bool, has_dot: bool, single_case: bool, is_long: bool) -> float:
+    """Text-quality confidence heuristic used when Whisper returns no segment info"""
+    confidence = 0.7  # Base confidence
+    
+    # Adjust based on text features
+    if is_long:
+        confidence += 0.1
+    if has_digit:
+        confidence += 0.05
+    if has_dot:  # Complete sentences
+        confidence += 0.1
+    if single_case:  # All caps or lowercase may indicate errors
+        confidence -= 0.2
+    
+    return min(1.0, max(0.0, confidence))
+
+# All 16 feature combinations, indexed by bits: 0=has_digit, 1=has_dot, 2=single_case, 3=len>10
+_HEURISTIC_CONFIDENCE = tuple(
+    _heuristic_confidence(bool(i & 1), bool(i & 2), bool(i & 4), bool(i & 8)) for i in range(16)
+)
+
+def _text_features(text: str) -> Tuple[bool, bool, bool]:
+    """
+    Return (has_digit, has_dot, single_case) for the confidence heuristic
+    ASCII text (the common case) is checked with C-level bytes operations;
+    other text is reduced to its distinct characters in one pass first
+    """
+    if text.isascii():
+        data = text.encode("ascii")
+        has_digit = len(data.translate(None, _ASCII_DIGITS)) != len(data)
+        return has_digit, b"." in data, data.isupper() or data.islower()
+    
+    distinct_chars = set(text)
+    distinct_text = "".join(distinct_chars)
+    has_digit = any(char.isdigit() for char in distinct_chars)
+    return has_digit, "." in distinct_chars, distinct_text.isupper() or distinct_text.islower()
+
 class SpeechRecognizer:
     """
     Speech recognition module
@@ -15,10 +83,45 @@ class SpeechRecognizer:
     Uses OpenAI Whisper API as the main recognition engine
     """
     
+    # JSON-friendly form of the supported formats, built once for health checks
+    _SUPPORTED_FORMATS_LIST = sorted(settings.SUPPORTED_AUDIO_FORMATS)
+    
     def __init__(self):
-        self.client = openai.AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
+        # Explicit connection pool so keep-alive connections are reused across requests
+        self.http_client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=settings.WHISPER_MAX_CONNECTIONS,
+                max_keepalive_connections=settings.WHISPER_MAX_CONNECTIONS
+            ),
+            http2=HTTP2_AVAILABLE,
+            timeout=settings.WHISPER_TIMEOUT
+        )
+        self.client = openai.AsyncOpenAI(
+            api_key=settings.OPENAI_API_KEY,
+            http_client=self.http_client
+        )
         self.model = settings.OPENAI_MODEL_WHISPER
-        logger.info(f"Speech Recognizer initialized with model: {self.model}")
+        # Caps concurrent Whisper uploads (open file handles, rate limits)
+        self._sem = asyncio.Semaphore(settings.WHISPER_MAX_CONCURRENCY)
+        # Exact-match transcription cache for in-memory audio: (model, format, content hash) -> result (LRU)
+        self._cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._cache_size = settings.TRANSCRIPTION_CACHE_SIZE
+        logger.info(f"Speech Recognizer initialized with model: {self.model} (http2={HTTP2_AVAILABLE})")
+    
+    async def warmup(self):
+        """
+        Warm up the HTTP connection pool
+        Pays DNS + TLS handshake once at startup instead of on the first transcription
+        """
+        try:
+            await self.client.models.list()
+            logger.info("Speech Recognizer connection pool warmed up")
+        except Exception as e:
+            logger.warning(f"Speech Recognizer warmup failed: {e}")
+    
+    async def close(self):
+        """Close the HTTP connection pool"""
+        await self.http_client.aclose()
     
     async def transcribe_file(self, file_path: str) -> Dict[str, Any]:
         """
@@ -33,41 +136,85 @@ class SpeechRecognizer:
         try:
             logger.info(f"Starting transcription of file: {file_path}")
             
-            # Verify file exists
-            if not Path(file_path).exists():
+            # Verify file exists and get its size (single stat call)
+            try:
+                file_size, _ = self._probe(file_path)
+            except FileNotFoundError:
                 raise FileNotFoundError(f"Audio file not found: {file_path}")
             
-            # Get file size
-            file_size = Path(file_path).stat().st_size
             if file_size > settings.MAX_AUDIO_SIZE:
                 raise ValueError(f"File too large: {file_size} bytes (max: {settings.MAX_AUDIO_SIZE})")
             
-            # Call Whisper API
-            with open(file_path, "rb") as audio_file:
-                transcript = await self.client.audio.transcriptions.create(
-                    model=self.model,
-                    file=audio_file,
-                    language="en",  # English interview
-                    response_format="verbose_json",  # Get detailed information
-                    temperature=0.0  # More accurate transcription
-                )
-            
-            # Process transcription results
-            result = {
-                "text": transcript.text.strip(),
-                "confidence": self._estimate_confidence(transcript),
-                "duration": getattr(transcript, 'duration', 0.0),
-                "language": getattr(transcript, 'language', 'en')
-            }
-            
-            logger.info(f"Transcription completed. Text length: {len(result['text'])} chars")
-            
-            return result
+            # Open off the event loop and hand the SDK the file handle (not its bytes):
+            # the multipart encoder then reads and sends the audio in 64 KB chunks
+            audio_file = await asyncio.to_thread(self._open_audio, file_path, file_size)
+            try:
+                return await self._transcribe_stream(audio_file, os.path.basename(file_path))
+            finally:
+                await asyncio.to_thread(audio_file.close)
             
         except Exception as e:
             logger.error(f"Transcription failed for {file_path}: {e}")
             raise Exception(f"Speech recognition failed: {str(e)}")
     
+    @staticmethod
+    def _probe(file_path: str) -> Tuple[int, str]:
+        """Return (size, lowercase extension) with a single stat call; raises FileNotFoundError"""
+        st = os.stat(file_path)
+        return st.st_size, os.path.splitext(file_path)[1][1:].lower()
+    
+    @staticmethod
+    def _open_audio(file_path: str, file_size: int):
+        """
+        Open an audio file for upload
+        Large files are memory-mapped so pages are faulted in as the uploader reads them
+        """
+        if file_size > MMAP_THRESHOLD:
+            with open(file_path, "rb") as f:
+                # mmap keeps its own reference to the file, so the handle can be closed here
+                return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return open(file_path, "rb")
+    
+    async def _transcribe_stream(self, file_obj, filename: str, cache: bool = True) -> Dict[str, Any]:
+        """Send a readable audio stream to Whisper and normalize the result (cache=False bypasses the LRU)"""
+        # Identical audio (re-sent utterance, client retry) is served from cache. Only audio that is
+        # already in memory is hashed - files and spooled uploads would need a second full read
+        digest = None
+        if cache and self._cache_size > 0 and isinstance(file_obj, io.BytesIO):
+            audio_format = os.path.splitext(filename)[1][1:].lower()
+            digest = f"{self.model}:{audio_format}:{await asyncio.to_thread(_audio_digest, file_obj)}"
+            cached = self._cache.get(digest)
+            if cached is not None:
+                self._cache.move_to_end(digest)
+                logger.info(f"Transcription cache hit for {filename}")
+                return dict(cached)
+        
+        # Call Whisper API
+        transcript = await self.client.audio.transcriptions.create(
+            model=self.model,
+            file=(filename, file_obj),
+            language="en",  # English interview
+            response_format="verbose_json",  # Get detailed information
+            temperature=0.0  # More accurate transcription
+        )
+        
+        # Process transcription results
+        result = {
+            "text": transcript.text.strip(),
+            "confidence": self._estimate_confidence(transcript),
+            "duration": getattr(transcript, 'duration', 0.0),
+            "language": getattr(transcript, 'language', 'en')
+        }
+        
+        logger.info(f"Transcription completed. Text length: {len(result['text'])} chars")
+        
+        if digest is not None:
+            self._cache[digest] = dict(result)
+            while len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+        
+        return result
+    
     async def transcribe_with_preprocessing(self, file_path: str) -> Dict[str, Any]:
         """
         Transcribe with preprocessing
@@ -85,38 +232,48 @@ class SpeechRecognizer:
             logger.error(f"Preprocessing transcription failed: {e}")
             raise
     
-    async def batch_transcribe(self, file_paths: list) -> Dict[str, Dict[str, Any]]:
+    async def _sem_transcribe(self, file_path: str) -> Dict[str, Any]:
+        """Transcribe a file while holding a concurrency slot"""
+        async with self._sem:
+            return await self.transcribe_file(file_path)
+    
+    async def batch_transcribe(self, file_paths: list) -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
         """
         Batch transcribe multiple audio files
+        Yields (file_path, result) as each transcription completes, so callers can
+        start downstream work (e.g. answer analysis) without waiting for the slowest file
+        
+        Usage:
+            async for file_path, result in recognizer.batch_transcribe(paths):
+                ...
         """
-        results = {}
+        async def _transcribe(file_path: str) -> Tuple[str, Dict[str, Any]]:
+            try:
+                result = await self._sem_transcribe(file_path)
+                return file_path, {"success": True, **result}
+            except Exception as e:
+                return file_path, {"success": False, "error": str(e)}
+        
+        # Missing files fail up front (concurrent stats) without taking a concurrency slot; size
+        # limits are left to transcribe_file, so the batch accepts exactly what it accepts
+        exists = await asyncio.gather(*(asyncio.to_thread(os.path.exists, file_path) for file_path in file_paths))
+        valid_paths = []
+        for file_path, found in zip(file_paths, exists):
+            if found:
+                valid_paths.append(file_path)
+            else:
+                yield file_path, {"success": False, "error": f"Speech recognition failed: Audio file not found: {file_path}"}
+        
+        # Process multiple files concurrently, at most WHISPER_MAX_CONCURRENCY uploads in flight
+        tasks = [asyncio.create_task(_transcribe(file_path)) for file_path in valid_paths]
         
         try:
-            # Process multiple files concurrently
-            tasks = [
-                self.transcribe_file(file_path) 
-                for file_path in file_paths
-            ]
-            
-            transcription_results = await asyncio.gather(*tasks, return_exceptions=True)
-            
-            for file_path, result in zip(file_paths, transcription_results):
-                if isinstance(result, Exception):
-                    results[file_path] = {
-                        "success": False,
-                        "error": str(result)
-                    }
-                else:
-                    results[file_path] = {
-                        "success": True,
-                        **result
-                    }
-            
-            return results
-            
-        except Exception as e:
-            logger.error(f"Batch transcription failed: {e}")
-            raise
+            for completed in asyncio.as_completed(tasks):
+                yield await completed
+        finally:
+            # Consumer stopped early - don't leave orphaned uploads running
+            for task in tasks:
+                task.cancel()
     
     def _estimate_confidence(self, transcript) -> float:
         """
@@ -127,35 +284,23 @@ class SpeechRecognizer:
             # Whisper API verbose_json format may include segment-level confidence
             if hasattr(transcript, 'segments') and transcript.segments:
                 # Calculate average confidence across all segments
-                confidences = []
-                for segment in transcript.segments:
-                    if hasattr(segment, 'avg_logprob'):
-                        # Convert log probability to 0-1 confidence range
-                        confidence = min(1.0, max(0.0, (segment.avg_logprob + 1.0)))
-                        confidences.append(confidence)
+                logprobs = [segment.avg_logprob for segment in transcript.segments if hasattr(segment, 'avg_logprob')]
                 
-                if confidences:
-                    return sum(confidences) / len(confidences)
+                if logprobs:
+                    # Convert log probability to 0-1 confidence range
+                    if np is not None:
+                        return float(np.clip(np.asarray(logprobs, dtype=np.float64) + 1.0, 0.0, 1.0).mean())
+                    return sum(min(1.0, max(0.0, logprob + 1.0)) for logprob in logprobs) / len(logprobs)
             
             # If no detailed info, estimate based on text quality
             text = transcript.text.strip()
             if not text:
                 return 0.0
             
-            # Simple heuristic evaluation
-            confidence = 0.7  # Base confidence
-            
-            # Adjust based on text features
-            if len(text) > 10:
-                confidence += 0.1
-            if any(char.isdigit() for char in text):
-                confidence += 0.05
-            if text.count('.') > 0:  # Complete sentences
-                confidence += 0.1
-            if text.isupper() or text.islower():  # All caps or lowercase may indicate errors
-                confidence -= 0.2
-            
-            return min(1.0, max(0.0, confidence))
+            # Simple heuristic evaluation - features index a precomputed score table
+            has_digit, has_dot, single_case = _text_features(text)
+            index = has_digit | (has_dot << 1) | (single_case << 2) | ((len(text) > 10) << 3)
+            return _HEURISTIC_CONFIDENCE[index]
             
         except Exception as e:
             logger.warning(f"Confidence estimation failed: {e}")
@@ -167,91 +312,95 @@ class SpeechRecognizer:
         Check if audio is suitable for transcription
         """
         try:
-            file_path_obj = Path(file_path)
-            
             # Basic file checks
-            if not file_path_obj.exists():
+            try:
+                file_size, file_extension = self._probe(file_path)
+            except FileNotFoundError:
                 return {"valid": False, "reason": "File not found"}
             
-            file_size = file_path_obj.stat().st_size
-            if file_size < 1024:  # Less than 1KB
-                return {"valid": False, "reason": "File too small"}
-            
-            if file_size > settings.MAX_AUDIO_SIZE:
-                return {"valid": False, "reason": "File too large"}
-            
-            # Check file format
-            file_extension = file_path_obj.suffix.lower().lstrip('.')
-            if file_extension not in settings.SUPPORTED_AUDIO_FORMATS:
-                return {
-                    "valid": False, 
-                    "reason": f"Unsupported format: {file_extension}"
-                }
-            
-            # TODO: Add more detailed audio quality checks
-            # - Audio duration
-            # - Sample rate
-            # - Bit rate
-            # - Noise level
-            
-            return {
-                "valid": True,
-                "file_size": file_size,
-                "format": file_extension
-            }
+            return self._check_audio(file_size, file_extension)
             
         except Exception as e:
             logger.error(f"Audio quality validation failed: {e}")
             return {"valid": False, "reason": f"Validation error: {str(e)}"}
     
+    @staticmethod
+    def _check_audio(file_size: int, file_extension: str) -> Dict[str, Any]:
+        """Size and format checks for validate_audio_quality"""
+        if file_size < 1024:  # Less than 1KB
+            return {"valid": False, "reason": "File too small"}
+        
+        if file_size > settings.MAX_AUDIO_SIZE:
+            return {"valid": False, "reason": "File too large"}
+        
+        # Check file format
+        if file_extension not in settings.SUPPORTED_AUDIO_FORMATS:
+            return {
+                "valid": False, 
+                "reason": f"Unsupported format: {file_extension}"
+            }
+        
+        # TODO: Add more detailed audio quality checks
+        # - Audio duration
+        # - Sample rate
+        # - Bit rate
+        # - Noise level
+        
+        return {
+            "valid": True,
+            "file_size": file_size,
+            "format": file_extension
+        }
+    
     async def transcribe_audio(
         self,
-        audio_content: bytes,
+        audio_content: Union[bytes, BinaryIO],
         audio_format: str,
-        session_id: str
+        session_id: str,
+        cache: bool = True
     ) -> Dict[str, Any]:
         """
-        Transcribe audio from bytes content
+        Transcribe audio from bytes content or a readable file object
         
         Args:
-            audio_content: Audio file content as bytes
+            audio_content: Audio content as bytes, or a binary file object (e.g. an upload's
+                spooled file) which is streamed without loading it into memory; the caller
+                is responsible for size checks on file objects
             audio_format: Audio file format (e.g., 'webm', 'mp3', 'wav')
             session_id: Session ID for logging
+            cache: Use the transcription cache; throwaway audio (e.g. partial transcripts) skips it
             
         Returns:
             Dict containing transcription text and metadata
         """
         try:
-            logger.info(f"[{session_id}] Starting audio transcription from bytes, format: {audio_format}")
-            
-            # Validate file size
-            if len(audio_content) > settings.MAX_AUDIO_SIZE:
-                raise ValueError(f"Audio content too large: {len(audio_content)} bytes (max: {settings.MAX_AUDIO_SIZE})")
+            logger.info(f"[{session_id}] Starting audio transcription, format: {audio_format}")
             
             # Validate format
             if audio_format not in settings.SUPPORTED_AUDIO_FORMATS:
                 raise ValueError(f"Unsupported audio format: {audio_format}")
             
-            # Create a file-like object from bytes
-            import io
-            audio_file = io.BytesIO(audio_content)
-            audio_file.name = f"audio.{audio_format}"  # Set filename for API
+            filename = f"audio.{audio_format}"  # Set filename for API
+            if isinstance(audio_content, (bytes, bytearray, memoryview)):
+                # Validate size
+                if len(audio_content) > settings.MAX_AUDIO_SIZE:
+                    raise ValueError(f"Audio content too large: {len(audio_content)} bytes (max: {settings.MAX_AUDIO_SIZE})")
+                
+                # Create a file-like object from the content (bytes are shared without a copy,
+                # bytearray/memoryview input is copied); the multipart encoder streams it in chunks
+                audio_file = io.BytesIO(audio_content)
+            else:
+                audio_file = audio_content
+                await asyncio.to_thread(audio_file.seek, 0)
             
-            # Call Whisper API
-            transcript = await self.client.audio.transcriptions.create(
-                model=self.model,
-                file=audio_file,
-                language="en",  # English interview
-                response_format="verbose_json",  # Get detailed information
-                temperature=0.0  # More accurate transcription
-            )
+            transcript = await self._transcribe_stream(audio_file, filename, cache)
             
-            # Process transcription results
+            # Keep the bytes API's result keys
             result = {
-                "transcription": transcript.text.strip(),
-                "confidence": self._estimate_confidence(transcript),
-                "duration": getattr(transcript, 'duration', 0.0),
-                "language": getattr(transcript, 'language', 'en')
+                "transcription": transcript["text"],
+                "confidence": transcript["confidence"],
+                "duration": transcript["duration"],
+                "language": transcript["language"]
             }
             
             logger.info(f"[{session_id}] Transcription completed. Text length: {len(result['transcription'])} chars")
@@ -281,7 +430,7 @@ class SpeechRecognizer:
             return {
                 "status": "healthy",
                 "model": self.model,
-                "supported_formats": settings.SUPPORTED_AUDIO_FORMATS,
+                "supported_formats": self._SUPPORTED_FORMATS_LIST,
                 "max_file_size": settings.MAX_AUDIO_SIZE
             }
             
@@ -1,7 +1,20 @@
-from pydantic import BaseModel, Field
-from typing import List, Optional, Dict, Any, Union, Literal
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, TypeAdapter
+from typing import List, Optional, Dict, Any, Union, Literal, Annotated
+from dataclasses import dataclass, field
 from datetime import datetime
-import base64
+import json
+
+from core.utils import iso_now
+
+try:
+    import orjson
+except ImportError:  # orjson is optional, fall back to pydantic's serializer
+    orjson = None
+
+try:
+    from pybase64 import b64decode as _b64decode  # SIMD-accelerated decoder
+except ImportError:
+    from base64 import b64decode as _b64decode
 
 # Request Models
 class InterviewInitializeRequest(BaseModel):
@@ -62,6 +75,9 @@ class JSONWorkflowResponse(BaseModel):
 
 # Response Models
 class InterviewQuestion(BaseModel):
+    # Frozen: question instances are prebuilt once and shared across requests
+    model_config = ConfigDict(frozen=True)
+    
     id: int
     question: str
     type: str
@@ -108,6 +124,7 @@ class InterviewCompletionResponse(BaseModel):
     total_questions_answered: int
     total_followups_asked: int
     session_duration: str
+    responses_url: str = Field(description="Paginated transcript of all answers")
 
 class InterviewReportRequest(BaseModel):
     """Interview report generation request"""
@@ -127,7 +144,7 @@ class ErrorResponse(BaseModel):
     message: str
     details: Optional[Dict[str, Any]] = None
     session_id: Optional[str] = None
-    timestamp: str = Field(default_factory=lambda: datetime.now().isoformat())
+    timestamp: str = Field(default_factory=iso_now)
 
 # Internal Models for AI Backend Communication
 class AIProcessingRequest(BaseModel):
@@ -147,6 +164,10 @@ class AIProcessingResponse(BaseModel):
     error_message: Optional[str] = None
 
 # WebSocket Message Models
+class WebSocketOpcode:
+    """First byte of binary WebSocket frames (rest of the frame is the raw payload)"""
+    AUDIO_FRAME = 0x01  # Audio chunk for the active audio stream
+
 class WebSocketMessageType:
     """WebSocket message type constants"""
     # Client to Server
@@ -156,6 +177,10 @@ class WebSocketMessageType:
     PING = "ping"
     DISCONNECT = "disconnect"
     
+    # Client to Server (streaming audio, framing binary audio frames)
+    AUDIO_START = "audio_start"
+    AUDIO_END = "audio_end"
+    
     # Server to Client
     CONNECTED = "connected"
     AI_RESPONSE = "ai_response"
@@ -168,8 +193,14 @@ class WebSocketMessage(BaseModel):
     """Base WebSocket message model"""
     type: str = Field(description="Message type")
     session_id: str = Field(description="Session identifier")
-    timestamp: str = Field(default_factory=lambda: datetime.now().isoformat())
+    timestamp: str = Field(default_factory=iso_now)
     data: Dict[str, Any] = Field(default_factory=dict, description="Message payload")
+    
+    def to_wire(self) -> bytes:
+        """Serialize to UTF-8 JSON for sending over the socket"""
+        if orjson is not None:
+            return orjson.dumps(self.model_dump(), default=str, option=orjson.OPT_SERIALIZE_NUMPY)
+        return self.model_dump_json().encode("utf-8")
 
 class ConnectMessage(WebSocketMessage):
     """Connection establishment message"""
@@ -179,35 +210,48 @@ class ConnectMessage(WebSocketMessage):
         "client_info": {}
     })
 
+class TextInputData(BaseModel):
+    """Text input message payload"""
+    text: str = ""
+    context: str = ""
+
+class AudioInputData(BaseModel):
+    """Audio input message payload"""
+    audio_data: str = Field(default="", description="Base64 encoded audio")
+    audio_format: str = "wav"
+    context: str = ""
+
 class TextInputMessage(WebSocketMessage):
     """Text input message from client"""
     type: Literal["text_input"] = "text_input"
-    data: Dict[str, Any] = Field(description="Text input data")
+    data: TextInputData = Field(description="Text input data")
     
     def get_text(self) -> str:
-        return self.data.get("text", "")
+        return self.data.text
     
     def get_context(self) -> str:
-        return self.data.get("context", "")
+        return self.data.context
 
 class AudioInputMessage(WebSocketMessage):
     """Audio input message from client"""
     type: Literal["audio_input"] = "audio_input"
-    data: Dict[str, Any] = Field(description="Audio input data")
+    data: AudioInputData = Field(description="Audio input data")
+    _decoded: Optional[bytes] = PrivateAttr(default=None)
     
     def get_audio_data(self) -> bytes:
-        """Decode base64 audio data"""
-        audio_b64 = self.data.get("audio_data", "")
-        try:
-            return base64.b64decode(audio_b64)
-        except Exception:
-            return b""
+        """Decode base64 audio data (decoded once per message)"""
+        if self._decoded is None:
+            try:
+                self._decoded = _b64decode(self.data.audio_data, validate=False)
+            except Exception:
+                self._decoded = b""
+        return self._decoded
     
     def get_audio_format(self) -> str:
-        return self.data.get("audio_format", "wav")
+        return self.data.audio_format
     
     def get_context(self) -> str:
-        return self.data.get("context", "")
+        return self.data.context
 
 class ConnectedMessage(WebSocketMessage):
     """Connection confirmation message"""
@@ -247,17 +291,71 @@ class PongMessage(WebSocketMessage):
     type: Literal["pong"] = "pong"
     data: Dict[str, Any] = Field(default_factory=dict)
 
+def pong_frame(session_id: str) -> str:
+    """Serialized PongMessage for the most frequent reply, built without a model round-trip"""
+    timestamp = iso_now()
+    return (
+        f'{{"type":"pong","session_id":{json.dumps(session_id)},'
+        f'"timestamp":"{timestamp}","data":{{"timestamp":"{timestamp}"}}}}'
+    )
+
+class DisconnectMessage(WebSocketMessage):
+    """Client-initiated disconnect message"""
+    type: Literal["disconnect"] = "disconnect"
+    data: Dict[str, Any] = Field(default_factory=dict)
+
+class AudioStartData(BaseModel):
+    """Audio stream start payload"""
+    audio_format: str = "webm"
+    context: str = ""
+
+class AudioStartMessage(WebSocketMessage):
+    """Begin a streamed utterance on the audio socket; binary frames follow"""
+    type: Literal["audio_start"] = "audio_start"
+    data: AudioStartData = Field(default_factory=AudioStartData)
+
+class AudioEndMessage(WebSocketMessage):
+    """End of streamed utterance - triggers final transcription and AI response"""
+    type: Literal["audio_end"] = "audio_end"
+    data: Dict[str, Any] = Field(default_factory=dict)
+
+# Client-to-server message parser: validates raw JSON straight into the right model,
+# using the `type` discriminator instead of json.loads + trial construction
+IncomingWebSocketMessage = Annotated[
+    Union[
+        ConnectMessage, TextInputMessage, AudioInputMessage, PingMessage, DisconnectMessage,
+        AudioStartMessage, AudioEndMessage
+    ],
+    Field(discriminator="type")
+]
+WS_IN_ADAPTER = TypeAdapter(IncomingWebSocketMessage)
+
+# Control messages accepted as text frames on the streaming audio socket
+AudioStreamControlMessage = Annotated[
+    Union[AudioStartMessage, AudioEndMessage, PingMessage],
+    Field(discriminator="type")
+]
+WS_AUDIO_CONTROL_ADAPTER = TypeAdapter(AudioStreamControlMessage)
+
 # WebSocket Connection Models
-class ConnectionInfo(BaseModel):
+# Internal per-connection state - plain slotted dataclasses, no validation needed after creation
+@dataclass(slots=True)
+class ConnectionInfo:
     """WebSocket connection information"""
     session_id: str
     client_address: str
     connected_at: datetime
-    last_activity: datetime
+    last_activity: float  # time.monotonic() of the last frame - cheap to stamp per message
     interview_style: str = "formal"
     is_active: bool = True
+    # connected_at never changes, so it is formatted once
+    connected_at_iso: str = field(init=False)
+    
+    def __post_init__(self):
+        self.connected_at_iso = self.connected_at.isoformat()
     
-class ConnectionStats(BaseModel):
+@dataclass(slots=True)
+class ConnectionStats:
     """Connection statistics"""
     total_connections: int
     active_connections: int
@@ -1,8 +1,20 @@
-from fastapi import APIRouter, HTTPException, UploadFile, File, Depends, Request, WebSocket, WebSocketDisconnect
+from fastapi import APIRouter, HTTPException, UploadFile, File, Depends, Query, Request, Response, WebSocket, WebSocketDisconnect
 from fastapi.responses import JSONResponse
 import logging
-from typing import Dict, List
+from typing import TYPE_CHECKING, AsyncIterator, Dict, List, Optional
 import asyncio
+import functools
+import os
+
+try:
+    import orjson  # noqa: F401 - required by ORJSONResponse
+    from fastapi.responses import ORJSONResponse as DefaultResponse
+except ImportError:  # orjson is optional, fall back to stdlib json encoding
+    DefaultResponse = JSONResponse
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from uuid import uuid4
+from pydantic import ValidationError
 
 from .models import (
     InterviewInitializeRequest, InterviewStartRequest, InterviewStartResponse,
@@ -13,31 +25,123 @@ from .models import (
     InterviewStatusResponse, InterviewCompletionResponse,
     InterviewReportRequest, InterviewReportResponse,
     ErrorResponse, InterviewQuestion,
-    WebSocketMessage, ErrorMessage, StatusMessage
+    WebSocketMessage, WebSocketMessageType, ErrorMessage, StatusMessage,
+    WS_AUDIO_CONTROL_ADAPTER
 )
-from .websocket_manager import connection_manager
+from .websocket_manager import AudioStream, connection_manager
 from core.utils import InterviewSession, ResponseFormatter, task_manager
+from core.session_cache import session_cache
 from core.config import settings
 
+if TYPE_CHECKING:
+    from ai_backend.coordinator import AICoordinator
+
 logger = logging.getLogger(__name__)
 
-# AI Coordinator will be accessed from app state
-def get_ai_coordinator(request):
-    """Get AI Coordinator from app state"""
-    return request.app.state.ai_coordinator
+router = APIRouter(default_response_class=DefaultResponse)
 
-router = APIRouter()
+async def _load_session(session_id: str) -> InterviewSession:
+    """Fetch interview session from the cache, 404 if it doesn't exist"""
+    session = await session_cache.get(session_id)
+    if session is None:
+        raise HTTPException(status_code=404, detail="Session not found")
+    return session
 
-# Store active interview sessions - now shared with WebSocket connection manager
-# This ensures HTTP API and WebSocket API use the same session storage
-def get_active_sessions():
-    """Get active session storage, shared with WebSocket manager"""
-    return connection_manager.interview_sessions
+async def get_session(session_id: str) -> InterviewSession:
+    """
+    Resolve interview session from path for read-only endpoints, 404 if it doesn't exist
+    Takes no lock; only refreshes the session's idle TTL
+    """
+    session = await _load_session(session_id)
+    await session_cache.touch(session_id)
+    return session
 
-active_sessions = get_active_sessions()
+@asynccontextmanager
+async def session_update(session_id: str) -> AsyncIterator[InterviewSession]:
+    """
+    Locked read-modify-write for endpoints that mutate a session without calling the AI backend
+    Used as `async with` in the handler body, so the lock is released before the response is sent
+    """
+    async with session_cache.update(session_id) as session:
+        if session is None:
+            raise HTTPException(status_code=404, detail="Session not found")
+        yield session
+
+@dataclass(slots=True)
+class RequestContext:
+    """Per-request state for endpoints that need both the session and the AI backend"""
+    session: InterviewSession
+    ai: "AICoordinator"
+
+# Bounds AI-backed requests in flight across all sessions
+_ai_slots = asyncio.Semaphore(settings.MAX_CONCURRENT_AI)
+
+async def get_ctx(session_id: str, request: Request) -> AsyncIterator[RequestContext]:
+    """
+    Resolve session and AI coordinator as a single dependency (one node in the dependency tree)
+    Takes a global AI slot (503 if none frees up in time) but no session lock - the AI call runs
+    unlocked and endpoints record its result through `session_cache.update` afterwards
+    """
+    session = await _load_session(session_id)
+    try:
+        await asyncio.wait_for(_ai_slots.acquire(), settings.AI_ADMISSION_TIMEOUT)
+    except asyncio.TimeoutError:
+        raise HTTPException(status_code=503, detail="AI backend is busy, please retry")
+    try:
+        yield RequestContext(session=session, ai=request.app.state.ai_coordinator)
+    finally:
+        _ai_slots.release()
+
+async def _record_ai_interaction(session_id: str, result: Dict):
+    """Append an AI result to the session under its lock (re-read, so concurrent updates aren't lost)"""
+    async with session_cache.update(session_id) as session:
+        if session is not None:
+            session.add_ai_interaction(
+                input_type=result["input_type"],
+                user_input=result["user_input"],
+                ai_response=result["ai_response"],
+                processing_time=result.get("processing_time", 0.0),
+                strategy_used=result.get("strategy_used", "unknown"),
+                transcription_info=result.get("transcription_info")
+            )
+
+async def get_upload_size(file: UploadFile) -> int:
+    """Size of an uploaded file, from the multipart parser or by seeking its spooled file"""
+    if file.size is not None:
+        return file.size
+    
+    def _measure() -> int:
+        size = file.file.seek(0, os.SEEK_END)
+        file.file.seek(0)
+        return size
+    
+    return await asyncio.to_thread(_measure)
+
+async def validate_audio_upload(file: UploadFile) -> str:
+    """
+    Reject uploads with no filename, an unsupported extension or an oversized body
+    Runs before the audio is read; returns the normalized file extension
+    """
+    if not file.filename:
+        raise HTTPException(status_code=400, detail="Audio file must have a filename")
+    
+    file_extension = os.path.splitext(file.filename)[1][1:].lower()
+    if file_extension not in settings.SUPPORTED_AUDIO_FORMATS:
+        raise HTTPException(
+            status_code=400, 
+            detail=f"Unsupported audio format. Supported: {sorted(settings.SUPPORTED_AUDIO_FORMATS)}"
+        )
+    
+    if await get_upload_size(file) > settings.MAX_AUDIO_SIZE:
+        raise HTTPException(
+            status_code=413,
+            detail=f"File too large. Max size: {settings.MAX_AUDIO_SIZE} bytes"
+        )
+    
+    return file_extension
 
-# Predefined interview questions
-INTERVIEW_QUESTIONS = [
+# Predefined interview questions (immutable, shared by all sessions)
+INTERVIEW_QUESTIONS = (
     {
         "id": 1,
         "question": "Please introduce yourself briefly, including your background, key experiences, and what you're looking for in your next role.",
@@ -62,110 +166,112 @@ INTERVIEW_QUESTIONS = [
         "type": "behavioral",
         "category": "team_integration"
     }
-]
+)
+
+# Validated once at import instead of per request
+INTERVIEW_QUESTION_MODELS: tuple[InterviewQuestion, ...] = tuple(InterviewQuestion(**q) for q in INTERVIEW_QUESTIONS)
+_TOTAL = len(INTERVIEW_QUESTIONS)
+
+# Health payload is constant - only the envelope timestamp is rendered per probe
+_HEALTH_DATA = {
+    "service": "AI Interviewer API Gateway",
+    "status": "healthy",
+    "version": "1.0.0"
+}
 
 @router.get("/health")
 async def health_check():
     """Health check endpoint"""
-    return ResponseFormatter.success_response({
-        "service": "AI Interviewer API Gateway",
-        "status": "healthy",
-        "version": "1.0.0"
-    })
+    return ResponseFormatter.success_response(_HEALTH_DATA)
 
 @router.post("/interview/initialize")
 async def initialize_interview_session(request: InterviewInitializeRequest):
     """Initialize interview session connection"""
-    try:
-        role = request.role
-        timestamp = request.timestamp
-        
-        # Generate new Session ID
-        import uuid
-        session_id = str(uuid.uuid4())
-        
-        # Create new session (but don't start interview process)
-        session = InterviewSession(session_id)
-        session.role = role
-        session.initialized_at = timestamp
-        
-        # Store session
-        get_active_sessions()[session_id] = session
-        
-        logger.info(f"Initialized interview session: {session_id} for role: {role}")
-        
-        return ResponseFormatter.success_response({
-            "session_id": session_id,
-            "role": role,
-            "status": "initialized",
-            "message": f"Interview session initialized for {role}"
-        })
-        
-    except Exception as e:
-        logger.error(f"Failed to initialize interview session: {e}")
-        raise HTTPException(
-            status_code=500,
-            detail=f"Failed to initialize interview session: {str(e)}"
-        )
+    role = request.role
+    timestamp = request.timestamp
+    
+    # Generate new Session ID
+    session_id = uuid4().hex
+    
+    # Create new session (but don't start interview process)
+    session = InterviewSession(session_id)
+    session.role = role
+    session.initialized_at = timestamp
+    
+    # Store session
+    await session_cache.set(session_id, session)
+    
+    logger.info("Initialized interview session: %s for role: %s", session_id, role)
+    
+    return ResponseFormatter.success_response({
+        "session_id": session_id,
+        "role": role,
+        "status": "initialized",
+        "message": f"Interview session initialized for {role}"
+    })
 
 @router.post("/interview/start", response_model=InterviewStartResponse)
 async def start_interview(request: InterviewStartRequest):
     """Start new interview session"""
-    try:
-        # Create new session
-        session = InterviewSession(request.session_id)
-        # Use dynamic session storage to ensure sharing with WebSocket
-        get_active_sessions()[session.session_id] = session
-        
-        logger.info(f"Started new interview session: {session.session_id}")
-        
-        # Return first question
-        first_question = InterviewQuestion(**INTERVIEW_QUESTIONS[0])
-        
-        response = InterviewStartResponse(
-            session_id=session.session_id,
-            message="Interview session started successfully",
-            first_question=first_question,
-            total_questions=len(INTERVIEW_QUESTIONS)
-        )
-        
-        return response
-        
-    except Exception as e:
-        logger.error(f"Failed to start interview: {e}")
-        raise HTTPException(
-            status_code=500,
-            detail=f"Failed to start interview session: {str(e)}"
-        )
+    # Create new session
+    session = InterviewSession(request.session_id)
+    # Session cache is shared with WebSocket
+    await session_cache.set(session.session_id, session)
+    
+    logger.info("Started new interview session: %s", session.session_id)
+    
+    # Return first question
+    first_question = INTERVIEW_QUESTION_MODELS[0]
+    
+    response = InterviewStartResponse(
+        session_id=session.session_id,
+        message="Interview session started successfully",
+        first_question=first_question,
+        total_questions=_TOTAL
+    )
+    
+    return response
+
+def _progress_etag(session: InterviewSession) -> str:
+    """ETag for polled session views - changes whenever interview progress does"""
+    return f'"{session.current_question_index}-{session.response_count}-{session.followup_count}-{int(session.is_completed)}"'
 
 @router.get("/interview/{session_id}/status", response_model=InterviewStatusResponse)
-async def get_interview_status(session_id: str):
-    """Get interview session status"""
-    sessions = get_active_sessions()
-    if session_id not in sessions:
-        raise HTTPException(status_code=404, detail="Session not found")
-    
-    session = sessions[session_id]
+async def get_interview_status(
+    session_id: str,
+    request: Request,
+    response: Response,
+    session: InterviewSession = Depends(get_session)
+):
+    """Get interview session status (304 when the client's ETag is current)"""
+    etag = _progress_etag(session)
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
     
     return InterviewStatusResponse(
         session_id=session_id,
         current_question_index=session.current_question_index,
-        total_questions=len(INTERVIEW_QUESTIONS),
+        total_questions=_TOTAL,
         is_completed=session.is_completed,
-        responses_count=len(session.user_responses),
-        followups_count=len(session.followup_questions)
+        responses_count=session.response_count,
+        followups_count=session.followup_count
     )
 
 @router.get("/interview/{session_id}/question")
-async def get_current_question(session_id: str):
-    """Get current question"""
-    sessions = get_active_sessions()
-    if session_id not in sessions:
-        raise HTTPException(status_code=404, detail="Session not found")
-    
-    session = sessions[session_id]
+async def get_current_question(
+    session_id: str,
+    request: Request,
+    response: Response,
+    session: InterviewSession = Depends(get_session)
+):
+    """Get current question (304 when the client's ETag is current)"""
+    etag = _progress_etag(session)
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
     
-    if session.current_question_index >= len(INTERVIEW_QUESTIONS):
+    if session.current_question_index >= _TOTAL:
         return ResponseFormatter.success_response({
             "message": "Interview completed",
             "is_completed": True
@@ -176,77 +282,44 @@ async def get_current_question(session_id: str):
     return ResponseFormatter.success_response({
         "question": current_question,
         "question_index": session.current_question_index,
-        "remaining_questions": len(INTERVIEW_QUESTIONS) - session.current_question_index - 1
+        "remaining_questions": _TOTAL - session.current_question_index - 1
     })
 
 @router.post("/interview/{session_id}/transcribe", response_model=TranscriptionResponse)
-async def transcribe_audio(session_id: str, file: UploadFile = File(...), request: Request = None):
+async def transcribe_audio(session_id: str, file: UploadFile = File(...), ctx: RequestContext = Depends(get_ctx)):
     """Transcribe audio file"""
-    sessions = get_active_sessions()
-    if session_id not in sessions:
-        raise HTTPException(status_code=404, detail="Session not found")
+    # Check filename, format and size before touching the audio
+    file_extension = await validate_audio_upload(file)
     
-    # Get AI coordinator
-    ai_coordinator = get_ai_coordinator(request)
+    # Call AI Backend's speech recognition module
+    # Pass the spooled upload file through, it is streamed to Whisper in chunks
+    transcription_result = await ctx.ai.transcribe_audio(
+        audio_content=file.file,
+        audio_format=file_extension,
+        session_id=session_id
+    )
     
-    try:
-        # Check file format
-        file_extension = file.filename.split('.')[-1].lower()
-        if file_extension not in settings.SUPPORTED_AUDIO_FORMATS:
-            raise HTTPException(
-                status_code=400, 
-                detail=f"Unsupported audio format. Supported: {settings.SUPPORTED_AUDIO_FORMATS}"
-            )
-        
-        # Read file content
-        content = await file.read()
-        if len(content) > settings.MAX_AUDIO_SIZE:
-            raise HTTPException(
-                status_code=400,
-                detail=f"File too large. Max size: {settings.MAX_AUDIO_SIZE} bytes"
-            )
-        
-        # Call AI Backend's speech recognition module
-        transcription_result = await ai_coordinator.transcribe_audio(
-            content, file_extension, session_id
-        )
-        
-        if not transcription_result["success"]:
-            raise HTTPException(
-                status_code=500,
-                detail=f"Transcription failed: {transcription_result.get('error', 'Unknown error')}"
-            )
-        
-        logger.info(f"Transcription completed for session {session_id}")
-        
-        return TranscriptionResponse(
-            session_id=session_id,
-            transcription=transcription_result["transcription"],
-            confidence=transcription_result["confidence"],
-            processing_time=transcription_result["processing_time"]
-        )
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Transcription failed for session {session_id}: {e}")
+    if not transcription_result["success"]:
         raise HTTPException(
             status_code=500,
-            detail=f"Transcription failed: {str(e)}"
+            detail=f"Transcription failed: {transcription_result.get('error', 'Unknown error')}"
         )
+    
+    logger.info("Transcription completed for session %s", session_id)
+    
+    return TranscriptionResponse(
+        session_id=session_id,
+        transcription=transcription_result["transcription"],
+        confidence=transcription_result["confidence"],
+        processing_time=transcription_result["processing_time"]
+    )
 
 @router.post("/interview/{session_id}/submit-answer")
 async def submit_answer(session_id: str, request: AnswerSubmissionRequest):
     """Submit user answer"""
-    sessions = get_active_sessions()
-    if session_id not in sessions:
-        raise HTTPException(status_code=404, detail="Session not found")
-    
-    session = sessions[session_id]
-    
-    try:
+    async with session_update(session_id) as session:
         # Get current question
-        if session.current_question_index >= len(INTERVIEW_QUESTIONS):
+        if session.current_question_index >= _TOTAL:
             raise HTTPException(status_code=400, detail="No more questions available")
         
         current_question = INTERVIEW_QUESTIONS[session.current_question_index]
@@ -258,90 +331,63 @@ async def submit_answer(session_id: str, request: AnswerSubmissionRequest):
             answer=request.answer
         )
         
-        logger.info(f"Answer submitted for session {session_id}, question {current_question['id']}")
+        logger.info("Answer submitted for session %s, question %s", session_id, current_question['id'])
         
         return ResponseFormatter.success_response({
             "message": "Answer submitted successfully",
             "question_id": current_question["id"],
             "next_step": "generate_followup"
         })
-        
-    except Exception as e:
-        logger.error(f"Failed to submit answer for session {session_id}: {e}")
-        raise HTTPException(
-            status_code=500,
-            detail=f"Failed to submit answer: {str(e)}"
-        )
 
 @router.post("/interview/{session_id}/process-unified", response_model=UnifiedInputResponse)
-async def process_unified_input(session_id: str, unified_request: UnifiedInputRequest, request: Request):
+async def process_unified_input(
+    session_id: str,
+    unified_request: UnifiedInputRequest,
+    ctx: RequestContext = Depends(get_ctx)
+):
     """
     Unified input processing endpoint: process text input, automatically route to planner and chatbot
     """
-    sessions = get_active_sessions()
-    if session_id not in sessions:
-        raise HTTPException(status_code=404, detail="Session not found")
+    logger.info("Processing unified text input for session %s", session_id)
+    
+    # Prepare input data
+    input_data = {
+        "text": unified_request.text,
+        "context": unified_request.context or ctx.session.get_context(),
+        "original_question": unified_request.original_question,
+        "interview_style": unified_request.interview_style
+    }
     
-    # Get AI coordinator
-    ai_coordinator = get_ai_coordinator(request)
-    session = sessions[session_id]
+    # Call AI Coordinator's unified processing method
+    result = await ctx.ai.process_unified_input(
+        input_data=input_data,
+        session_id=session_id
+    )
     
-    try:
-        logger.info(f"Processing unified text input for session {session_id}")
-        
-        # Prepare input data
-        input_data = {
-            "text": unified_request.text,
-            "context": unified_request.context or session.get_context(),
-            "original_question": unified_request.original_question,
-            "interview_style": unified_request.interview_style
-        }
-        
-        # Call AI Coordinator's unified processing method
-        result = await ai_coordinator.process_unified_input(
-            input_data=input_data,
-            session_id=session_id
-        )
-        
-        if not result.get("success", True):
-            raise HTTPException(
-                status_code=500,
-                detail=f"Unified processing failed: {result.get('error', 'Unknown error')}"
-            )
-        
-        logger.info(f"Unified processing completed for session {session_id}")
-        
-        # Record AI interaction in session
-        session.add_ai_interaction(
-            input_type=result["input_type"],
-            user_input=result["user_input"],
-            ai_response=result["ai_response"],
-            processing_time=result.get("processing_time", 0.0),
-            strategy_used=result.get("strategy_used", "unknown"),
-            transcription_info=result.get("transcription_info")
-        )
-        
-        return UnifiedInputResponse(
-            session_id=session_id,
-            input_type=result["input_type"],
-            user_input=result["user_input"],
-            ai_response=result["ai_response"],
-            response_type=result.get("response_type", "question"),
-            strategy_used=result.get("strategy_used", "unknown"),
-            focus_area=result.get("focus_area", "general"),
-            confidence=result.get("confidence", 0.5),
-            processing_time=result.get("processing_time", 0.0),
-            transcription_info=result.get("transcription_info")
-        )
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Unified processing failed for session {session_id}: {e}")
+    if not result.get("success", True):
         raise HTTPException(
             status_code=500,
-            detail=f"Unified processing failed: {str(e)}"
+            detail=f"Unified processing failed: {result.get('error', 'Unknown error')}"
         )
+    
+    logger.info("Unified processing completed for session %s", session_id)
+    
+    # Record AI interaction in session
+    await _record_ai_interaction(session_id, result)
+    
+    # Built from already-validated AI backend results - skip re-validation
+    return UnifiedInputResponse.model_construct(
+        session_id=session_id,
+        input_type=result["input_type"],
+        user_input=result["user_input"],
+        ai_response=result["ai_response"],
+        response_type=result.get("response_type", "question"),
+        strategy_used=result.get("strategy_used", "unknown"),
+        focus_area=result.get("focus_area", "general"),
+        confidence=result.get("confidence", 0.5),
+        processing_time=result.get("processing_time", 0.0),
+        transcription_info=result.get("transcription_info")
+    )
 
 @router.post("/interview/{session_id}/process-unified-audio", response_model=UnifiedInputResponse)
 async def process_unified_audio(
@@ -350,212 +396,139 @@ async def process_unified_audio(
     context: str = None,
     original_question: str = None,
     interview_style: str = "formal",
-    request: Request = None
+    ctx: RequestContext = Depends(get_ctx)
 ):
     """
     Unified audio processing endpoint: process audio files, transcribe and route to planner and chatbot
     """
-    sessions = get_active_sessions()
-    if session_id not in sessions:
-        raise HTTPException(status_code=404, detail="Session not found")
+    # Check filename, format and size before touching the audio
+    file_extension = await validate_audio_upload(file)
     
-    # Get AI coordinator
-    ai_coordinator = get_ai_coordinator(request)
-    session = sessions[session_id]
+    logger.info("Processing unified audio input for session %s", session_id)
     
-    try:
-        # Check file format
-        file_extension = file.filename.split('.')[-1].lower()
-        if file_extension not in settings.SUPPORTED_AUDIO_FORMATS:
-            raise HTTPException(
-                status_code=400, 
-                detail=f"Unsupported audio format. Supported: {settings.SUPPORTED_AUDIO_FORMATS}"
-            )
-        
-        # Read file content
-        content = await file.read()
-        if len(content) > settings.MAX_AUDIO_SIZE:
-            raise HTTPException(
-                status_code=400,
-                detail=f"File too large. Max size: {settings.MAX_AUDIO_SIZE} bytes"
-            )
-        
-        logger.info(f"Processing unified audio input for session {session_id}")
-        
-        # Prepare input data
-        input_data = {
-            "audio_content": content,
-            "audio_format": file_extension,
-            "context": context or session.get_context(),
-            "original_question": original_question,
-            "interview_style": interview_style
-        }
-        
-        # Call AI Coordinator's unified processing method
-        result = await ai_coordinator.process_unified_input(
-            input_data=input_data,
-            session_id=session_id
-        )
-        
-        if not result.get("success", True):
-            raise HTTPException(
-                status_code=500,
-                detail=f"Unified audio processing failed: {result.get('error', 'Unknown error')}"
-            )
-        
-        logger.info(f"Unified audio processing completed for session {session_id}")
-        
-        # Record AI interaction in session
-        session.add_ai_interaction(
-            input_type=result["input_type"],
-            user_input=result["user_input"],
-            ai_response=result["ai_response"],
-            processing_time=result.get("processing_time", 0.0),
-            strategy_used=result.get("strategy_used", "unknown"),
-            transcription_info=result.get("transcription_info")
-        )
-        
-        return UnifiedInputResponse(
-            session_id=session_id,
-            input_type=result["input_type"],
-            user_input=result["user_input"],
-            ai_response=result["ai_response"],
-            response_type=result.get("response_type", "question"),
-            strategy_used=result.get("strategy_used", "unknown"),
-            focus_area=result.get("focus_area", "general"),
-            confidence=result.get("confidence", 0.5),
-            processing_time=result.get("processing_time", 0.0),
-            transcription_info=result.get("transcription_info")
-        )
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Unified audio processing failed for session {session_id}: {e}")
+    # Prepare input data
+    input_data = {
+        "audio_content": file.file,
+        "audio_format": file_extension,
+        "context": context or ctx.session.get_context(),
+        "original_question": original_question,
+        "interview_style": interview_style
+    }
+    
+    # Call AI Coordinator's unified processing method
+    result = await ctx.ai.process_unified_input(
+        input_data=input_data,
+        session_id=session_id
+    )
+    
+    if not result.get("success", True):
         raise HTTPException(
             status_code=500,
-            detail=f"Unified audio processing failed: {str(e)}"
+            detail=f"Unified audio processing failed: {result.get('error', 'Unknown error')}"
         )
+    
+    logger.info("Unified audio processing completed for session %s", session_id)
+    
+    # Record AI interaction in session
+    await _record_ai_interaction(session_id, result)
+    
+    # Built from already-validated AI backend results - skip re-validation
+    return UnifiedInputResponse.model_construct(
+        session_id=session_id,
+        input_type=result["input_type"],
+        user_input=result["user_input"],
+        ai_response=result["ai_response"],
+        response_type=result.get("response_type", "question"),
+        strategy_used=result.get("strategy_used", "unknown"),
+        focus_area=result.get("focus_area", "general"),
+        confidence=result.get("confidence", 0.5),
+        processing_time=result.get("processing_time", 0.0),
+        transcription_info=result.get("transcription_info")
+    )
 
 @router.post("/interview/{session_id}/process-json", response_model=JSONWorkflowResponse)
-async def process_json_workflow(session_id: str, json_request: JSONWorkflowRequest, request: Request):
+async def process_json_workflow(session_id: str, json_request: JSONWorkflowRequest, ctx: RequestContext = Depends(get_ctx)):
     """
     Process JSON workflow: receive JSON data containing user input and planner suggestions, generate response
     """
-    sessions = get_active_sessions()
-    if session_id not in sessions:
-        raise HTTPException(status_code=404, detail="Session not found")
+    logger.info("Processing JSON workflow for session %s", session_id)
     
-    # Get AI coordinator
-    ai_coordinator = get_ai_coordinator(request)
+    # Call AI Coordinator's JSON workflow processing
+    result = await ctx.ai.process_json_workflow(
+        json_data=json_request.json_data,
+        session_id=session_id
+    )
     
-    try:
-        logger.info(f"Processing JSON workflow for session {session_id}")
-        
-        # Call AI Coordinator's JSON workflow processing
-        result = await ai_coordinator.process_json_workflow(
-            json_data=json_request.json_data,
-            session_id=session_id
-        )
-        
-        if not result.get("success", True):
-            raise HTTPException(
-                status_code=500,
-                detail=f"JSON workflow failed: {result.get('error', 'Unknown error')}"
-            )
-        
-        logger.info(f"JSON workflow completed for session {session_id}")
-        
-        return JSONWorkflowResponse(
-            session_id=session_id,
-            response=result["question"],
-            response_type=result.get("response_type", "question"),
-            strategy_used=result.get("strategy_used", "unknown"),
-            focus_area=result.get("focus_area", "general"),
-            confidence=result.get("confidence", 0.5),
-            processing_time=result.get("processing_time", 0.0),
-            alternatives=result.get("alternatives", [])
-        )
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"JSON workflow failed for session {session_id}: {e}")
+    if not result.get("success", True):
         raise HTTPException(
             status_code=500,
-            detail=f"JSON workflow failed: {str(e)}"
+            detail=f"JSON workflow failed: {result.get('error', 'Unknown error')}"
         )
+    
+    logger.info("JSON workflow completed for session %s", session_id)
+    
+    # Built from already-validated AI backend results - skip re-validation
+    return JSONWorkflowResponse.model_construct(
+        session_id=session_id,
+        response=result["question"],
+        response_type=result.get("response_type", "question"),
+        strategy_used=result.get("strategy_used", "unknown"),
+        focus_area=result.get("focus_area", "general"),
+        confidence=result.get("confidence", 0.5),
+        processing_time=result.get("processing_time", 0.0),
+        alternatives=result.get("alternatives", [])
+    )
 
 @router.post("/interview/{session_id}/generate-followup", response_model=FollowUpResponse)
-async def generate_followup(session_id: str, followup_request: FollowUpRequest, request: Request):
+async def generate_followup(
+    session_id: str,
+    followup_request: FollowUpRequest,
+    ctx: RequestContext = Depends(get_ctx)
+):
     """Generate follow-up question"""
-    sessions = get_active_sessions()
-    if session_id not in sessions:
-        raise HTTPException(status_code=404, detail="Session not found")
-    
-    session = sessions[session_id]
+    # Get current question information
+    current_question = INTERVIEW_QUESTIONS[ctx.session.current_question_index]["question"]
     
-    # Get AI coordinator
-    ai_coordinator = get_ai_coordinator(request)
+    # Call AI Backend's chatbot and planning modules
+    followup_result = await ctx.ai.generate_followup_question(
+        user_answer=followup_request.original_answer,
+        original_question=current_question,
+        conversation_context=ctx.session.get_context(),
+        session_id=session_id,
+        interview_style="formal"  # Can be obtained from session
+    )
     
-    try:
-        # Get current question information
-        current_question = INTERVIEW_QUESTIONS[session.current_question_index]["question"]
-        
-        # Call AI Backend's chatbot and planning modules
-        followup_result = await ai_coordinator.generate_followup_question(
-            user_answer=followup_request.original_answer,
-            original_question=current_question,
-            conversation_context=session.get_context(),
-            session_id=session_id,
-            interview_style="formal"  # Can be obtained from session
-        )
-        
-        if not followup_result["success"]:
-            raise HTTPException(
-                status_code=500,
-                detail=f"Followup generation failed: {followup_result.get('error', 'Unknown error')}"
-            )
-        
-        followup = followup_result["followup_question"]
-        
-        # Update last answer in session, add follow-up question
-        if session.user_responses:
-            session.user_responses[-1]["followup"] = followup
-            session.followup_questions.append(followup)
-        
-        logger.info(f"Followup generated for session {session_id}: {followup[:50]}...")
-        
-        return FollowUpResponse(
-            session_id=session_id,
-            followup_question=followup,
-            context_used=True,
-            generation_time=followup_result["processing_time"]
-        )
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Failed to generate followup for session {session_id}: {e}")
+    if not followup_result["success"]:
         raise HTTPException(
             status_code=500,
-            detail=f"Failed to generate followup: {str(e)}"
+            detail=f"Followup generation failed: {followup_result.get('error', 'Unknown error')}"
         )
+    
+    followup = followup_result["followup_question"]
+    
+    # Update last answer in session, add follow-up question
+    async with session_cache.update(session_id) as session:
+        if session is not None:
+            session.set_last_followup(followup)
+    
+    logger.info("Followup generated for session %s: %.50s...", session_id, followup)
+    
+    # Built from already-validated AI backend results - skip re-validation
+    return FollowUpResponse.model_construct(
+        session_id=session_id,
+        followup_question=followup,
+        context_used=True,
+        generation_time=followup_result["processing_time"]
+    )
 
 @router.post("/interview/{session_id}/next-question")
 async def move_to_next_question(session_id: str):
     """Move to next question"""
-    sessions = get_active_sessions()
-    if session_id not in sessions:
-        raise HTTPException(status_code=404, detail="Session not found")
-    
-    session = sessions[session_id]
-    
-    try:
+    async with session_update(session_id) as session:
         session.next_question()
         
         # Check if there are more questions
-        if session.current_question_index >= len(INTERVIEW_QUESTIONS):
+        if session.current_question_index >= _TOTAL:
             session.complete()
             return ResponseFormatter.success_response({
                 "message": "Interview completed",
@@ -569,93 +542,90 @@ async def move_to_next_question(session_id: str):
         return ResponseFormatter.success_response({
             "question": next_question,
             "question_index": session.current_question_index,
-            "remaining_questions": len(INTERVIEW_QUESTIONS) - session.current_question_index - 1,
+            "remaining_questions": _TOTAL - session.current_question_index - 1,
             "next_step": "answer_question"
         })
+
+@router.get("/interview/{session_id}/complete", response_model=InterviewCompletionResponse)
+async def complete_interview(session_id: str, request: Request):
+    """
+    Complete interview and return summary
+    Answers are not embedded; they are paged from the transcript endpoint at `responses_url`
+    """
+    async with session_update(session_id) as session:
+        session.complete()
+        duration = str(session.duration())
+        
+        # Generate interview summary
+        summary = {
+            "questions_answered": session.response_count,
+            "followups_generated": session.followup_count,
+            "session_duration": duration
+        }
         
-    except Exception as e:
-        logger.error(f"Failed to move to next question for session {session_id}: {e}")
-        raise HTTPException(
-            status_code=500,
-            detail=f"Failed to move to next question: {str(e)}"
+        # Note: Session is not deleted here, it expires from the session cache after SESSION_CACHE_TTL idle seconds
+        
+        return InterviewCompletionResponse(
+            session_id=session_id,
+            message="Interview completed successfully",
+            summary=summary,
+            total_questions_answered=session.response_count,
+            total_followups_asked=session.followup_count,
+            session_duration=duration,
+            responses_url=str(request.url_for("get_interview_transcript", session_id=session_id))
         )
 
-@router.get("/interview/{session_id}/complete", response_model=InterviewCompletionResponse)
-async def complete_interview(session_id: str):
-    """Complete interview and return summary"""
-    sessions = get_active_sessions()
-    if session_id not in sessions:
-        raise HTTPException(status_code=404, detail="Session not found")
-    
-    session = sessions[session_id]
-    session.complete()
-    
-    # Generate interview summary
-    summary = {
-        "questions_answered": len(session.user_responses),
-        "followups_generated": len(session.followup_questions),
-        "session_duration": str(datetime.now() - session.created_at),
-        "responses": session.user_responses
-    }
-    
-    # Note: No longer deleting session, maintain session memory until service shutdown
-    # This ensures conversation memory is maintained throughout service lifecycle
-    
-    return InterviewCompletionResponse(
-        session_id=session_id,
-        message="Interview completed successfully",
-        summary=summary,
-        total_questions_answered=len(session.user_responses),
-        total_followups_asked=len(session.followup_questions),
-        session_duration=str(datetime.now() - session.created_at)
-    )
+@router.get("/interview/{session_id}/transcript")
+async def get_interview_transcript(
+    session_id: str,
+    offset: int = Query(0, ge=0),
+    limit: int = Query(50, ge=1, le=500),
+    session: InterviewSession = Depends(get_session)
+):
+    """Page through the session's answers (column arrays, sliced to offset:offset+limit)"""
+    end = offset + limit
+    return ResponseFormatter.success_response({
+        "session_id": session_id,
+        "offset": offset,
+        "limit": limit,
+        "total": session.response_count,
+        "responses": {name: column[offset:end] for name, column in session.responses_summary().items()}
+    })
 
 @router.post("/interview/{session_id}/generate-report", response_model=InterviewReportResponse)
-async def generate_interview_report(session_id: str, report_request: InterviewReportRequest, request: Request):
+async def generate_interview_report(
+    session_id: str,
+    report_request: InterviewReportRequest,
+    ctx: RequestContext = Depends(get_ctx)
+):
     """Generate interview report"""
-    sessions = get_active_sessions()
-    if session_id not in sessions:
-        raise HTTPException(status_code=404, detail="Session not found")
+    logger.info("Generating interview report for session %s", session_id)
     
-    # Get AI coordinator
-    ai_coordinator = get_ai_coordinator(request)
+    # Call AI Coordinator to generate report
+    report_result = await ctx.ai.generate_interview_report(
+        session_id=session_id,
+        candidate_name=report_request.candidate_name
+    )
     
-    try:
-        logger.info(f"Generating interview report for session {session_id}")
-        
-        # Call AI Coordinator to generate report
-        report_result = await ai_coordinator.generate_interview_report(
-            session_id=session_id,
-            candidate_name=report_request.candidate_name
-        )
-        
-        if not report_result.get("success", False):
-            raise HTTPException(
-                status_code=500,
-                detail=f"Report generation failed: {report_result.get('error', 'Unknown error')}"
-            )
-        
-        logger.info(f"Interview report generated successfully for session {session_id}")
-        
-        return InterviewReportResponse(
-            session_id=session_id,
-            success=True,
-            report=report_result["report"],
-            generated_at=report_result["generated_at"]
-        )
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Failed to generate interview report for session {session_id}: {e}")
+    if not report_result.get("success", False):
         raise HTTPException(
             status_code=500,
-            detail=f"Failed to generate interview report: {str(e)}"
+            detail=f"Report generation failed: {report_result.get('error', 'Unknown error')}"
         )
+    
+    logger.info("Interview report generated successfully for session %s", session_id)
+    
+    # Built from already-validated AI backend results - skip re-validation
+    return InterviewReportResponse.model_construct(
+        session_id=session_id,
+        success=True,
+        report=report_result["report"],
+        generated_at=report_result["generated_at"]
+    )
 
 # Error handling function (will be registered to FastAPI application in main.py)
 async def http_exception_handler(request, exc):
-    return JSONResponse(
+    return DefaultResponse(
         status_code=exc.status_code,
         content=ResponseFormatter.error_response(
             error=exc.detail,
@@ -663,12 +633,59 @@ async def http_exception_handler(request, exc):
         )
     )
 
-from datetime import datetime
+async def unhandled_exception_handler(request: Request, exc: Exception):
+    """Log unexpected endpoint errors and return them in the standard error envelope"""
+    logger.exception("Unhandled error on %s %s", request.method, request.url.path)
+    return DefaultResponse(
+        status_code=500,
+        content=ResponseFormatter.error_response(
+            error="Internal server error",
+            code=500,
+            details="An unexpected error occurred" if not settings.DEBUG else str(exc)
+        )
+    )
 
 # ==============================================================================
 # WebSocket Routes for Real-time Communication
 # ==============================================================================
 
+async def _websocket_worker(queue: asyncio.Queue, session_id: str):
+    """Run queued AI-backed jobs for one connection in arrival order"""
+    while True:
+        job = await queue.get()
+        try:
+            response_message = await job()
+        except Exception as e:
+            logger.exception("Error in WebSocket worker for %s", session_id)
+            response_message = ErrorMessage(
+                session_id=session_id,
+                data={
+                    "error": "message_processing_error",
+                    "message": "An error occurred while processing your message",
+                    "details": str(e) if settings.DEBUG else "Internal error"
+                }
+            )
+        
+        if response_message:
+            await connection_manager.send_message(session_id, response_message)
+
+def _queue_full_error(session_id: str, message_type: str) -> ErrorMessage:
+    """
+    Reject a message that found the connection's job queue full
+    Queued jobs are candidate answers and are never dropped - the client retries the new one
+    """
+    connection_manager.stats.errors_count += 1
+    logger.warning("WebSocket queue full for %s, rejected %s", session_id, message_type)
+    return ErrorMessage(
+        session_id=session_id,
+        data={
+            "error": "message_rejected",
+            "message": "Too many pending messages, please retry",
+            "rejected_type": message_type,
+            "retryable": True
+        }
+    )
+
 @router.websocket("/ws/{session_id}")
 async def websocket_endpoint(websocket: WebSocket, session_id: str):
     """
@@ -676,35 +693,59 @@ async def websocket_endpoint(websocket: WebSocket, session_id: str):
     Supports real-time text and audio input processing
     """
     actual_session_id = None
+    worker = None
     
     try:
         # Establish connection
         actual_session_id = await connection_manager.connect(websocket, session_id)
-        logger.info(f"WebSocket connection established: {actual_session_id}")
+        logger.info("WebSocket connection established: %s", actual_session_id)
         
         # Get AI coordinator (needs to be obtained from app state)
         ai_coordinator = websocket.app.state.ai_coordinator
         
+        # Slow (AI-backed) messages are queued to a worker so a long AI call
+        # doesn't stall pings, control messages and audio frames behind it
+        queue: asyncio.Queue = asyncio.Queue(maxsize=settings.WS_MESSAGE_QUEUE_SIZE)
+        worker = asyncio.create_task(_websocket_worker(queue, actual_session_id))
+        
         while True:
             try:
-                # Receive message
-                raw_message = await websocket.receive_text()
+                # Receive frame: binary = opcode-framed audio, text = JSON control channel
+                frame = await websocket.receive()
+                if frame["type"] == "websocket.disconnect":
+                    logger.info("WebSocket client disconnected: %s", actual_session_id)
+                    break
                 
                 # Process message
-                response_message = await connection_manager.handle_message(
-                    actual_session_id, raw_message, ai_coordinator
-                )
+                if frame.get("bytes") is not None:
+                    response_message = connection_manager.handle_binary(
+                        actual_session_id, frame["bytes"], ai_coordinator
+                    )
+                else:
+                    message = connection_manager.parse_message(actual_session_id, frame["text"])
+                    
+                    if connection_manager.is_deferred(message):
+                        if queue.full():
+                            # Checked before deferring, so a rejected audio_end keeps its stream
+                            response_message = _queue_full_error(actual_session_id, message.type)
+                        else:
+                            response_message = None
+                            queue.put_nowait(connection_manager.defer_message(actual_session_id, message, ai_coordinator))
+                    else:
+                        response_message = await connection_manager.dispatch_message(
+                            actual_session_id, message, ai_coordinator
+                        )
                 
                 # Send response (if any)
                 if response_message:
                     await connection_manager.send_message(actual_session_id, response_message)
                     
             except WebSocketDisconnect:
-                logger.info(f"WebSocket client disconnected: {actual_session_id}")
+                logger.info("WebSocket client disconnected: %s", actual_session_id)
                 break
                 
             except Exception as e:
-                logger.error(f"Error in WebSocket message loop for {actual_session_id}: {e}")
+                logger.exception("Error in WebSocket message loop for %s", actual_session_id)
                 
                 # Send error message
                 error_msg = ErrorMessage(
@@ -722,14 +763,108 @@ async def websocket_endpoint(websocket: WebSocket, session_id: str):
                     # If error message cannot be sent, connection may be broken
                     break
     
-    except Exception as e:
-        logger.error(f"WebSocket connection error: {e}")
+    except Exception:
+        logger.exception("WebSocket connection error")
         
     finally:
+        # Stop processing queued messages for this connection
+        if worker is not None:
+            worker.cancel()
+        
         # Clean up connection
         if actual_session_id:
             await connection_manager.disconnect(actual_session_id, "connection_ended")
 
+@router.websocket("/ws/{session_id}/audio")
+async def websocket_audio_stream(websocket: WebSocket, session_id: str):
+    """
+    Streaming audio WebSocket endpoint
+    Text frames carry control messages (audio_start / audio_end / ping); binary frames carry
+    ~250-500 ms audio chunks. Partial transcripts are pushed while the user speaks and the
+    final AI response follows audio_end. The REST audio endpoints remain as a fallback.
+    """
+    await websocket.accept()
+    
+    if await session_cache.get(session_id) is None:
+        error_msg = ErrorMessage(
+            session_id=session_id,
+            data={"error": "session_not_found", "message": "Interview session not found"}
+        )
+        await websocket.send_text(error_msg.to_wire().decode("utf-8"))
+        await websocket.close(code=4404)
+        return
+    
+    ai_coordinator = websocket.app.state.ai_coordinator
+    connection_id = connection_manager.connect_audio(websocket, session_id)
+    
+    # This socket's utterance, kept apart from binary audio on the main socket
+    stream: Optional[AudioStream] = None
+    
+    # Finished utterances run on a worker so pings and the next utterance's frames aren't
+    # stuck behind Whisper + LLM; every frame goes out through the connection's writer
+    queue: asyncio.Queue = asyncio.Queue(maxsize=settings.WS_MESSAGE_QUEUE_SIZE)
+    worker = asyncio.create_task(_websocket_worker(queue, connection_id))
+    
+    try:
+        while True:
+            frame = await websocket.receive()
+            if frame["type"] == "websocket.disconnect":
+                break
+            connection_manager.record_received(connection_id)
+            
+            if frame.get("bytes") is not None:
+                response_message = connection_manager.append_audio_frame(session_id, stream, frame["bytes"], ai_coordinator)
+                if response_message is not None and stream is not None:
+                    stream.cancel_partial()
+                    stream = None
+            else:
+                try:
+                    message = WS_AUDIO_CONTROL_ADAPTER.validate_json(frame.get("text") or "")
+                except ValidationError as e:
+                    response_message = ErrorMessage(
+                        session_id=session_id,
+                        data={
+                            "error": "validation_error",
+                            "message": "Invalid audio stream control message",
+                            "details": str(e)
+                        }
+                    )
+                else:
+                    if message.type == WebSocketMessageType.AUDIO_START:
+                        if stream is not None:
+                            stream.cancel_partial()
+                        stream = connection_manager.new_audio_stream(
+                            connection_id, session_id, message.data.audio_format, message.data.context
+                        )
+                        response_message = None
+                    elif message.type == WebSocketMessageType.AUDIO_END:
+                        if queue.full():
+                            response_message = _queue_full_error(session_id, message.type)
+                        else:
+                            finished, stream = stream, None
+                            queue.put_nowait(functools.partial(
+                                connection_manager.process_audio_stream, session_id, finished, ai_coordinator
+                            ))
+                            response_message = None
+                    else:
+                        await connection_manager.send_pong(connection_id, session_id)
+                        response_message = None
+            
+            if response_message:
+                await connection_manager.send_message(connection_id, response_message)
+    
+    except WebSocketDisconnect:
+        pass
+    
+    except Exception:
+        logger.exception("Audio stream socket error for %s", session_id)
+    
+    finally:
+        worker.cancel()
+        if stream is not None:
+            stream.cancel_partial()
+        await connection_manager.disconnect_audio(connection_id, websocket)
+
 @router.websocket("/ws")
 async def websocket_endpoint_auto_session(websocket: WebSocket):
     """
@@ -744,138 +879,91 @@ async def websocket_endpoint_auto_session(websocket: WebSocket):
 @router.get("/websocket/stats")
 async def get_websocket_stats():
     """Get WebSocket connection statistics"""
-    try:
-        stats = connection_manager.get_connection_stats()
-        return ResponseFormatter.success_response({
-            "websocket_stats": stats.model_dump(),
-            "active_sessions": connection_manager.get_active_sessions()
-        })
-    except Exception as e:
-        logger.error(f"Failed to get WebSocket stats: {e}")
-        raise HTTPException(status_code=500, detail="Failed to retrieve WebSocket statistics")
+    return ResponseFormatter.success_response(connection_manager.get_stats_snapshot())
 
 @router.get("/websocket/sessions")
 async def get_active_websocket_sessions():
     """Get all active WebSocket sessions"""
-    try:
-        active_sessions = connection_manager.get_active_sessions()
-        session_details = []
-        
-        for session_id in active_sessions:
-            session_info = connection_manager.get_session_info(session_id)
-            if session_info:
-                session_details.append({
-                    "session_id": session_id,
-                    "client_address": session_info.client_address,
-                    "connected_at": session_info.connected_at.isoformat(),
-                    "last_activity": session_info.last_activity.isoformat(),
-                    "interview_style": session_info.interview_style,
-                    "is_active": session_info.is_active
-                })
-        
-        return ResponseFormatter.success_response({
-            "active_sessions_count": len(active_sessions),
-            "sessions": session_details
-        })
-    except Exception as e:
-        logger.error(f"Failed to get active sessions: {e}")
-        raise HTTPException(status_code=500, detail="Failed to retrieve active sessions")
+    active_sessions = connection_manager.get_active_sessions()
+    get_details = connection_manager.get_session_details
+    session_details = [details for session_id in active_sessions if (details := get_details(session_id))]
+    
+    return ResponseFormatter.success_response({
+        "active_sessions_count": len(active_sessions),
+        "sessions": session_details
+    })
 
 @router.get("/websocket/sessions/{session_id}")
 async def get_websocket_session_info(session_id: str):
     """Get information for specified WebSocket session"""
-    try:
-        session_info = connection_manager.get_session_info(session_id)
-        
-        if not session_info:
-            raise HTTPException(status_code=404, detail="Session not found")
-        
-        # Get interview session information (if exists)
-        interview_session = connection_manager.interview_sessions.get(session_id)
-        interview_data = None
-        
-        if interview_session:
-            interview_data = {
-                "session_id": interview_session.session_id,
-                "created_at": interview_session.created_at.isoformat(),
-                "is_completed": interview_session.is_completed,
-                "current_question_index": interview_session.current_question_index,
-                "responses_count": len(interview_session.user_responses),
-                "ai_interactions_count": len(interview_session.ai_interactions)
-            }
-        
-        return ResponseFormatter.success_response({
-            "connection_info": {
-                "session_id": session_info.session_id,
-                "client_address": session_info.client_address,
-                "connected_at": session_info.connected_at.isoformat(),
-                "last_activity": session_info.last_activity.isoformat(),
-                "interview_style": session_info.interview_style,
-                "is_active": session_info.is_active
-            },
-            "interview_session": interview_data,
-            "is_websocket_active": connection_manager.is_session_active(session_id)
-        })
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Failed to get session info for {session_id}: {e}")
-        raise HTTPException(status_code=500, detail="Failed to retrieve session information")
+    connection_details = connection_manager.get_session_details(session_id)
+    
+    if not connection_details:
+        raise HTTPException(status_code=404, detail="Session not found")
+    
+    # Get interview session information (if exists)
+    interview_session = await session_cache.get(session_id)
+    interview_data = None
+    
+    if interview_session:
+        interview_data = {
+            "session_id": interview_session.session_id,
+            "created_at": interview_session.created_at.isoformat(),
+            "is_completed": interview_session.is_completed,
+            "current_question_index": interview_session.current_question_index,
+            "responses_count": interview_session.response_count,
+            "ai_interactions_count": interview_session.ai_interaction_count
+        }
+    
+    return ResponseFormatter.success_response({
+        "connection_info": connection_details,
+        "interview_session": interview_data,
+        "is_websocket_active": connection_manager.is_session_active(session_id)
+    })
 
 @router.post("/websocket/sessions/{session_id}/message")
 async def send_message_to_websocket_session(session_id: str, message: Dict):
-    """Send message to specified WebSocket session (management interface)"""
-    try:
-        if not connection_manager.is_session_active(session_id):
-            raise HTTPException(status_code=404, detail="Session not active")
-        
-        # Create status message
-        status_message = StatusMessage(
-            session_id=session_id,
-            data=message
-        )
-        
-        success = await connection_manager.send_message(session_id, status_message)
-        
-        if not success:
-            raise HTTPException(status_code=500, detail="Failed to send message")
-        
-        return ResponseFormatter.success_response({
-            "message": "Message sent successfully",
-            "session_id": session_id,
-            "message_type": "status"
-        })
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Failed to send message to session {session_id}: {e}")
-        raise HTTPException(status_code=500, detail="Failed to send message")
+    """
+    Send message to specified WebSocket session (management interface)
+    The message is queued for the connection's writer; delivery is not awaited
+    """
+    if not connection_manager.is_session_active(session_id):
+        raise HTTPException(status_code=404, detail="Session not active")
+    
+    # Create status message
+    status_message = StatusMessage(
+        session_id=session_id,
+        data=message
+    )
+    
+    queued = await connection_manager.send_message(session_id, status_message)
+    
+    if not queued:
+        raise HTTPException(status_code=500, detail="Failed to queue message")
+    
+    return ResponseFormatter.success_response({
+        "message": "Message queued for delivery",
+        "queued": True,
+        "session_id": session_id,
+        "message_type": "status"
+    })
 
 @router.post("/websocket/broadcast")
 async def broadcast_message_to_all_sessions(message: Dict, exclude_sessions: List[str] = None):
     """Broadcast message to all WebSocket sessions (management interface)"""
-    try:
-        # Create status message
-        broadcast_message = StatusMessage(
-            session_id="broadcast",
-            data=message
-        )
-        
-        exclude_set = set(exclude_sessions) if exclude_sessions else set()
-        
-        await connection_manager.broadcast_message(broadcast_message, exclude_set)
-        
-        active_sessions = connection_manager.get_active_sessions()
-        target_sessions = [s for s in active_sessions if s not in exclude_set]
-        
-        return ResponseFormatter.success_response({
-            "message": "Broadcast completed",
-            "target_sessions_count": len(target_sessions),
-            "excluded_sessions_count": len(exclude_set),
-            "message_type": "status"
-        })
-        
-    except Exception as e:
-        logger.error(f"Failed to broadcast message: {e}")
-        raise HTTPException(status_code=500, detail="Failed to broadcast message")
\ No newline at end of file
+    # Create status message
+    broadcast_message = StatusMessage(
+        session_id="broadcast",
+        data=message
+    )
+    
+    exclude_set = set(exclude_sessions) if exclude_sessions else set()
+    
+    target_sessions_count = await connection_manager.broadcast_message(broadcast_message, exclude_set)
+    
+    return ResponseFormatter.success_response({
+        "message": "Broadcast completed",
+        "target_sessions_count": target_sessions_count,
+        "excluded_sessions_count": len(exclude_set),
+        "message_type": "status"
+    })
@@ -6,24 +6,97 @@ Supports long-lived connections for real-time interview interactions.
 """
 
 import asyncio
-import json
+import heapq
 import logging
-from datetime import datetime
-from typing import Dict, List, Optional, Set
-import uuid
+import time
+from dataclasses import asdict
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+from uuid import uuid4
 from fastapi import WebSocket, WebSocketDisconnect
+from starlette.websockets import WebSocketState
 from pydantic import ValidationError
 
 from .models import (
     WebSocketMessage, WebSocketMessageType, ConnectionInfo, ConnectionStats,
     ConnectMessage, TextInputMessage, AudioInputMessage, ConnectedMessage,
     AIResponseMessage, TranscriptionMessage, ErrorMessage, StatusMessage,
-    PingMessage, PongMessage
+    PingMessage, AudioStartMessage, AudioEndMessage, WebSocketOpcode, WS_IN_ADAPTER, pong_frame
 )
+from core.config import settings
+from core.session_cache import session_cache
 from core.utils import InterviewSession, ResponseFormatter
 
 logger = logging.getLogger(__name__)
 
+# How long monitoring endpoints may serve a cached stats snapshot (seconds)
+STATS_CACHE_TTL = 1.0
+
+# Connections with no traffic for this long (seconds) are closed by the heartbeat
+IDLE_TIMEOUT = 300.0
+
+# Messages that wait on the AI backend - processed by the per-connection worker
+# so they don't stall the receive loop
+DEFERRED_MESSAGE_TYPES = frozenset({
+    WebSocketMessageType.TEXT_INPUT,
+    WebSocketMessageType.AUDIO_INPUT,
+    WebSocketMessageType.AUDIO_END
+})
+
+class AudioStream:
+    """
+    Streaming utterance state for one connection (main socket or dedicated audio socket)
+    Small frames (~250-500 ms from MediaRecorder timeslices) are appended as they arrive;
+    `send` delivers serialized partial transcripts to the connection that owns the stream
+    Partials transcribe only audio that no earlier partial covered, so each byte is uploaded once
+    """
+    
+    def __init__(self, session_id: str, send: Callable[[str], Awaitable[Any]], audio_format: str = "webm", context: str = ""):
+        self.session_id = session_id
+        self.send = send
+        self.audio_format = audio_format
+        self.context = context
+        self.buffer = bytearray()
+        self.frame_count = 0
+        self.header_size = 0  # First frame carries the container header (MediaRecorder / WAV)
+        self.partial_offset = 0  # Buffer bytes already sent for partial transcription
+        self.last_partial_at = time.monotonic()
+        self.partial_text = ""
+        self.partial_task: Optional[asyncio.Task] = None
+    
+    def append(self, frame: bytes):
+        """Add a frame to the utterance"""
+        if not self.buffer:
+            self.header_size = len(frame)
+        self.buffer += frame
+        self.frame_count += 1
+    
+    def take_partial_window(self) -> bytes:
+        """
+        Audio received since the last partial, prefixed with the first frame so the
+        container header is present and the window decodes on its own
+        """
+        start = max(self.partial_offset, self.header_size)
+        window = bytes(self.buffer[:self.header_size]) + bytes(self.buffer[start:])
+        self.partial_offset = len(self.buffer)
+        return window
+    
+    def partial_due(self) -> bool:
+        """Whether enough new audio has arrived to refresh the partial transcript"""
+        if self.partial_task is not None and not self.partial_task.done():
+            return False
+        return time.monotonic() - self.last_partial_at >= settings.STREAM_PARTIAL_INTERVAL
+    
+    def cancel_partial(self):
+        """Cancel an in-flight partial transcription"""
+        if self.partial_task is not None and not self.partial_task.done():
+            self.partial_task.cancel()
+        self.partial_task = None
+
+def audio_connection_id(session_id: str) -> str:
+    """Connection ID of a session's dedicated audio socket (distinct from the main socket's session ID)"""
+    return f"{session_id}/audio"
+
 class ConnectionManager:
     """
     WebSocket connection manager
@@ -34,11 +107,24 @@ class ConnectionManager:
         # Active WebSocket connections
         self.active_connections: Dict[str, WebSocket] = {}
         
+        # Dedicated /ws/{id}/audio sockets, keyed by audio_connection_id (not broadcast targets)
+        self.audio_connections: Dict[str, WebSocket] = {}
+        
         # Connection information storage
         self.connection_info: Dict[str, ConnectionInfo] = {}
         
-        # Interview session storage (shared with HTTP API)
-        self.interview_sessions: Dict[str, InterviewSession] = {}
+        # Interview sessions live in core.session_cache (shared with HTTP API)
+        
+        # Outbound frames per connection, drained by one writer task each (bounded = backpressure)
+        self.outbound_queues: Dict[str, asyncio.Queue] = {}
+        self.writer_tasks: Dict[str, asyncio.Task] = {}
+        
+        # Partial transcriptions in flight across all streams
+        self._partial_slots = asyncio.Semaphore(settings.WS_PARTIAL_MAX_CONCURRENCY)
+        
+        # Streaming audio utterances sent as binary frames on the main socket
+        # (the /ws/{id}/audio socket keeps its own stream per connection)
+        self.audio_streams: Dict[str, AudioStream] = {}
         
         # Statistics
         self.stats = ConnectionStats(
@@ -53,6 +139,29 @@ class ConnectionManager:
         # Start time
         self.start_time = datetime.now()
         
+        # Monitoring caches: stats payload (monotonic time, payload), active session ID
+        # snapshot (rebuilt after connect/cleanup) and per-session details keyed by state
+        self._stats_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+        self._active_sessions_cache: Optional[List[str]] = None
+        self._session_details_cache: Dict[str, Tuple[tuple, Dict[str, Any]]] = {}
+        
+        # Idle deadlines as a min-heap of (deadline, session_id), one entry per connection;
+        # entries are re-checked against last_activity when they come due
+        self._idle_heap: List[Tuple[float, str]] = []
+        self._idle_scheduled: Set[str] = set()
+        
+        # Message type -> handler, all called as handler(session_id, message, ai_coordinator)
+        self._dispatch: Dict[str, Callable[..., Awaitable[Optional[WebSocketMessage]]]] = {
+            WebSocketMessageType.ERROR: self._handle_error,
+            WebSocketMessageType.PING: self._handle_ping,
+            WebSocketMessageType.TEXT_INPUT: self._handle_text_input,
+            WebSocketMessageType.AUDIO_INPUT: self._handle_audio_input,
+            WebSocketMessageType.CONNECT: self._handle_connect,
+            WebSocketMessageType.AUDIO_START: self._handle_audio_start,
+            WebSocketMessageType.AUDIO_END: self._handle_audio_end,
+            WebSocketMessageType.DISCONNECT: self._handle_disconnect,
+        }
+        
         # Heartbeat task
         self.heartbeat_task: Optional[asyncio.Task] = None
         
@@ -71,7 +180,7 @@ class ConnectionManager:
         """
         # Generate or use provided session_id
         if not session_id:
-            session_id = str(uuid.uuid4())
+            session_id = uuid4().hex
         
         try:
             # Accept WebSocket connection
@@ -79,24 +188,13 @@ class ConnectionManager:
             
             # Store connection
             self.active_connections[session_id] = websocket
-            
-            # Create connection info
-            client_address = f"{websocket.client.host}:{websocket.client.port}" if websocket.client else "unknown"
-            self.connection_info[session_id] = ConnectionInfo(
-                session_id=session_id,
-                client_address=client_address,
-                connected_at=datetime.now(),
-                last_activity=datetime.now(),
-                is_active=True
-            )
+            self._active_sessions_cache = None
+            client_address = self._register(session_id, session_id, websocket)
             
             # Create or get interview session
-            if session_id not in self.interview_sessions:
-                self.interview_sessions[session_id] = InterviewSession(session_id)
-            
-            # Update statistics
-            self.stats.total_connections += 1
-            self.stats.active_connections = len(self.active_connections)
+            async with session_cache.lock(session_id):
+                if await session_cache.get(session_id) is None:
+                    await session_cache.set(session_id, InterviewSession(session_id))
             
             logger.info(f"WebSocket connected: {session_id} from {client_address}")
             
@@ -110,10 +208,6 @@ class ConnectionManager:
                 }
             ))
             
-            # Start heartbeat check (if not already started)
-            if not self.heartbeat_task:
-                self.heartbeat_task = asyncio.create_task(self._heartbeat_loop())
-            
             return session_id
             
         except Exception as e:
@@ -121,6 +215,72 @@ class ConnectionManager:
             await self._cleanup_connection(session_id)
             raise
     
+    def connect_audio(self, websocket: WebSocket, session_id: str) -> str:
+        """
+        Register an accepted /ws/{id}/audio socket for an existing session
+        It gets its own writer, idle tracking and stats, but is not a broadcast target
+        
+        Returns:
+            str: Connection ID to send and disconnect with
+        """
+        connection_id = audio_connection_id(session_id)
+        # A reconnecting audio socket replaces the previous one
+        previous = self.audio_connections.get(connection_id)
+        if previous is not None and previous is not websocket:
+            self._stop_writer(connection_id)
+            asyncio.create_task(self._close_socket(previous))
+        self.audio_connections[connection_id] = websocket
+        client_address = self._register(connection_id, session_id, websocket)
+        logger.info(f"Audio socket connected: {session_id} from {client_address}")
+        return connection_id
+    
+    def _register(self, connection_id: str, session_id: str, websocket: WebSocket) -> str:
+        """Start a connection's writer, connection info and idle tracking; returns the client address"""
+        # Start the connection's writer (replacing one left by a previous socket for this connection)
+        self._stop_writer(connection_id)
+        queue = asyncio.Queue(maxsize=settings.WS_OUTBOUND_QUEUE_SIZE)
+        self.outbound_queues[connection_id] = queue
+        self.writer_tasks[connection_id] = asyncio.create_task(self._writer(connection_id, websocket, queue))
+        
+        # Create connection info
+        client_address = f"{websocket.client.host}:{websocket.client.port}" if websocket.client else "unknown"
+        now = time.monotonic()
+        self.connection_info[connection_id] = ConnectionInfo(
+            session_id=session_id,
+            client_address=client_address,
+            connected_at=datetime.now(),
+            last_activity=now,
+            is_active=True
+        )
+        if connection_id not in self._idle_scheduled:
+            self._idle_scheduled.add(connection_id)
+            heapq.heappush(self._idle_heap, (now + IDLE_TIMEOUT, connection_id))
+        
+        # Update statistics
+        self.stats.total_connections += 1
+        self.stats.active_connections = len(self.active_connections) + len(self.audio_connections)
+        
+        # Start heartbeat check (if not already started)
+        if not self.heartbeat_task:
+            self.heartbeat_task = asyncio.create_task(self._heartbeat_loop())
+        
+        return client_address
+    
+    def record_received(self, connection_id: str):
+        """Count an inbound frame and refresh the connection's idle deadline"""
+        self.stats.messages_received += 1
+        info = self.connection_info.get(connection_id)
+        if info is not None:
+            info.last_activity = time.monotonic()
+    
+    async def close_all(self):
+        """Close every connection (application shutdown)"""
+        if self.heartbeat_task is not None:
+            self.heartbeat_task.cancel()
+            self.heartbeat_task = None
+        for connection_id in [*self.active_connections, *self.audio_connections]:
+            await self._cleanup_connection(connection_id)
+    
     async def disconnect(self, session_id: str, reason: str = "client_disconnect"):
         """
         Disconnect WebSocket connection
@@ -132,64 +292,100 @@ class ConnectionManager:
         logger.info(f"Disconnecting WebSocket: {session_id}, reason: {reason}")
         await self._cleanup_connection(session_id)
     
+    async def disconnect_audio(self, connection_id: str, websocket: WebSocket):
+        """Clean up an audio socket, unless a reconnect has already replaced it"""
+        if self.audio_connections.get(connection_id) is websocket:
+            await self._cleanup_connection(connection_id)
+    
     async def send_message(self, session_id: str, message: WebSocketMessage) -> bool:
         """
-        Send message to specified session
+        Queue message for the session's writer task
         
         Args:
             session_id: Target Session ID
             message: Message to send
             
         Returns:
-            bool: Whether send was successful
+            bool: Whether the message was queued
+        """
+        # Serialize in the producer - kept as a text frame, browser clients JSON.parse(event.data)
+        queued = await self._send_raw(session_id, message.to_wire().decode("utf-8"))
+        if queued:
+            logger.debug(f"Message queued for {session_id}: {message.type}")
+        return queued
+    
+    async def _send_raw(self, session_id: str, text: str) -> bool:
         """
-        if session_id not in self.active_connections:
+        Queue an already-serialized frame (e.g. shared by a broadcast)
+        A client whose outbound queue is full is too slow to keep up and gets disconnected
+        """
+        queue = self.outbound_queues.get(session_id)
+        if queue is None:
             logger.warning(f"Attempted to send message to non-existent connection: {session_id}")
             return False
         
-        websocket = self.active_connections[session_id]
-        
         try:
-            # Serialize message
-            message_json = message.model_dump_json()
-            
-            # Send message
-            await websocket.send_text(message_json)
-            
-            # Update statistics and activity time
-            self.stats.messages_sent += 1
-            if session_id in self.connection_info:
-                self.connection_info[session_id].last_activity = datetime.now()
-            
-            logger.debug(f"Message sent to {session_id}: {message.type}")
-            return True
-            
-        except Exception as e:
-            logger.error(f"Failed to send message to {session_id}: {e}")
+            queue.put_nowait(text)
+        except asyncio.QueueFull:
+            logger.warning(f"Outbound queue full for {session_id}, disconnecting slow client")
             self.stats.errors_count += 1
-            # Connection may be broken, clean up
             await self._cleanup_connection(session_id)
             return False
+        return True
+    
+    async def _writer(self, session_id: str, websocket: WebSocket, queue: asyncio.Queue):
+        """Drain one connection's outbound queue into its socket, one frame at a time"""
+        while True:
+            text = await queue.get()
+            try:
+                await websocket.send_text(text)
+            except Exception as e:
+                logger.error(f"Failed to send message to {session_id}: {e}")
+                self.stats.errors_count += 1
+                # Connection may be broken, clean up
+                await self._cleanup_connection(session_id)
+                return
+            
+            # Update statistics and activity time
+            self.stats.messages_sent += 1
+            info = self.connection_info.get(session_id)
+            if info is not None:
+                info.last_activity = time.monotonic()
+    
+    def _stop_writer(self, session_id: str):
+        """Drop a connection's outbound queue and stop its writer (unless called from the writer itself)"""
+        self.outbound_queues.pop(session_id, None)
+        task = self.writer_tasks.pop(session_id, None)
+        if task is not None and task is not asyncio.current_task():
+            task.cancel()
     
-    async def broadcast_message(self, message: WebSocketMessage, exclude_sessions: Set[str] = None):
+    async def broadcast_message(self, message: WebSocketMessage, exclude_sessions: Set[str] = None) -> int:
         """
         Broadcast message to all connections (optionally excluding certain sessions)
         
         Args:
             message: Message to broadcast
             exclude_sessions: Set of Session IDs to exclude
+            
+        Returns:
+            int: Number of sessions targeted
         """
         exclude_sessions = exclude_sessions or set()
         
-        tasks = []
-        for session_id in self.active_connections:
-            if session_id not in exclude_sessions:
-                tasks.append(self.send_message(session_id, message))
+        # Serialize and decode once, every recipient queues the same string
+        text = message.to_wire().decode("utf-8")
+        
+        # Snapshot - evicting a slow client mutates active_connections
+        targets = [session_id for session_id in self.active_connections if session_id not in exclude_sessions]
+        
+        successful = 0
+        for session_id in targets:
+            successful += await self._send_raw(session_id, text)
+        
+        if targets:
+            logger.info(f"Broadcast completed: {successful}/{len(targets)} queued")
         
-        if tasks:
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-            successful = sum(1 for r in results if r is True)
-            logger.info(f"Broadcast completed: {successful}/{len(tasks)} successful")
+        return len(targets)
     
     async def handle_message(self, session_id: str, raw_message: str, ai_coordinator) -> Optional[WebSocketMessage]:
         """
@@ -203,36 +399,41 @@ class ConnectionManager:
         Returns:
             Optional[WebSocketMessage]: Response message (if any)
         """
+        message = self.parse_message(session_id, raw_message)
+        return await self.dispatch_message(session_id, message, ai_coordinator)
+    
+    def parse_message(self, session_id: str, raw_message: str) -> WebSocketMessage:
+        """
+        Parse and validate a raw JSON message in one step
+        
+        Returns:
+            WebSocketMessage: Typed message, or ErrorMessage if it failed validation
+        """
+        # Update statistics and activity time
+        self.record_received(session_id)
+        
         try:
-            # Update statistics and activity time
-            self.stats.messages_received += 1
-            if session_id in self.connection_info:
-                self.connection_info[session_id].last_activity = datetime.now()
-            
-            # Parse message
-            message_data = json.loads(raw_message)
-            message_type = message_data.get("type")
-            
-            logger.debug(f"Received message from {session_id}: {message_type}")
-            
-            # Route message to appropriate handler
-            if message_type == WebSocketMessageType.PING:
-                return await self._handle_ping(session_id, message_data)
-            
-            elif message_type == WebSocketMessageType.TEXT_INPUT:
-                return await self._handle_text_input(session_id, message_data, ai_coordinator)
-            
-            elif message_type == WebSocketMessageType.AUDIO_INPUT:
-                return await self._handle_audio_input(session_id, message_data, ai_coordinator)
-            
-            elif message_type == WebSocketMessageType.CONNECT:
-                return await self._handle_connect(session_id, message_data)
+            message = WS_IN_ADAPTER.validate_json(raw_message)
+            logger.debug(f"Received message from {session_id}: {message.type}")
+            return message
+        
+        except ValidationError as e:
+            self.stats.errors_count += 1
+            error = e.errors()[0]
             
-            elif message_type == WebSocketMessageType.DISCONNECT:
-                await self.disconnect(session_id, "client_requested")
-                return None
+            if error["type"] == "json_invalid":
+                logger.error(f"Invalid JSON from {session_id}: {e}")
+                return ErrorMessage(
+                    session_id=session_id,
+                    data={
+                        "error": "invalid_json",
+                        "message": "Invalid JSON format",
+                        "details": str(e)
+                    }
+                )
             
-            else:
+            if error["type"] in ("union_tag_invalid", "union_tag_not_found"):
+                message_type = error.get("ctx", {}).get("tag")
                 logger.warning(f"Unknown message type from {session_id}: {message_type}")
                 return ErrorMessage(
                     session_id=session_id,
@@ -242,22 +443,8 @@ class ConnectionManager:
                         "received_type": message_type
                     }
                 )
-        
-        except json.JSONDecodeError as e:
-            logger.error(f"Invalid JSON from {session_id}: {e}")
-            self.stats.errors_count += 1
-            return ErrorMessage(
-                session_id=session_id,
-                data={
-                    "error": "invalid_json",
-                    "message": "Invalid JSON format",
-                    "details": str(e)
-                }
-            )
-        
-        except ValidationError as e:
+            
             logger.error(f"Message validation error from {session_id}: {e}")
-            self.stats.errors_count += 1
             return ErrorMessage(
                 session_id=session_id,
                 data={
@@ -266,6 +453,28 @@ class ConnectionManager:
                     "details": str(e)
                 }
             )
+    
+    def is_deferred(self, message: WebSocketMessage) -> bool:
+        """Whether a message waits on the AI backend and should run on the session worker"""
+        return message.type in DEFERRED_MESSAGE_TYPES
+    
+    def defer_message(self, session_id: str, message: WebSocketMessage, ai_coordinator) -> Callable[[], Awaitable[Optional[WebSocketMessage]]]:
+        """
+        Bind a slow message to a job for the session's worker queue
+        audio_end detaches the audio stream right away, so frames of the next utterance start a fresh stream
+        """
+        if message.type == WebSocketMessageType.AUDIO_END:
+            stream = self.audio_streams.pop(session_id, None)
+            return lambda: self.process_audio_stream(session_id, stream, ai_coordinator)
+        return lambda: self.dispatch_message(session_id, message, ai_coordinator)
+    
+    async def dispatch_message(self, session_id: str, message: WebSocketMessage, ai_coordinator) -> Optional[WebSocketMessage]:
+        """Route a parsed message to its handler"""
+        try:
+            handler = self._dispatch.get(message.type)
+            if handler is None:
+                return None
+            return await handler(session_id, message, ai_coordinator)
         
         except Exception as e:
             logger.error(f"Error handling message from {session_id}: {e}")
@@ -279,18 +488,33 @@ class ConnectionManager:
                 }
             )
     
-    async def _handle_ping(self, session_id: str, message_data: dict) -> PongMessage:
+    async def _handle_error(self, session_id: str, error_msg: ErrorMessage, ai_coordinator) -> ErrorMessage:
+        """Parse errors are passed straight back to the client"""
+        return error_msg
+    
+    async def _handle_audio_start(self, session_id: str, start_msg: AudioStartMessage, ai_coordinator) -> None:
+        """Begin a streamed utterance on the main socket"""
+        self.start_audio_stream(session_id, start_msg.data.audio_format, start_msg.data.context)
+    
+    async def _handle_audio_end(self, session_id: str, end_msg: AudioEndMessage, ai_coordinator) -> Optional[WebSocketMessage]:
+        """Finish the streamed utterance and process it"""
+        return await self.finish_audio_stream(session_id, ai_coordinator)
+    
+    async def _handle_disconnect(self, session_id: str, message: WebSocketMessage, ai_coordinator) -> None:
+        """Client asked to close the connection"""
+        await self.disconnect(session_id, "client_requested")
+    
+    async def _handle_ping(self, session_id: str, ping_msg: PingMessage, ai_coordinator) -> None:
         """Handle heartbeat ping message"""
-        return PongMessage(
-            session_id=session_id,
-            data={"timestamp": datetime.now().isoformat()}
-        )
+        await self.send_pong(session_id, session_id)
+    
+    async def send_pong(self, connection_id: str, session_id: str) -> bool:
+        """Queue a pre-formatted pong frame for the connection"""
+        return await self._send_raw(connection_id, pong_frame(session_id))
     
-    async def _handle_connect(self, session_id: str, message_data: dict) -> StatusMessage:
+    async def _handle_connect(self, session_id: str, connect_msg: ConnectMessage, ai_coordinator) -> StatusMessage:
         """Handle connection configuration message"""
         try:
-            connect_msg = ConnectMessage(**message_data)
-            
             # Update connection configuration
             if session_id in self.connection_info:
                 self.connection_info[session_id].interview_style = connect_msg.data.get("interview_style", "formal")
@@ -314,53 +538,13 @@ class ConnectionManager:
                 }
             )
     
-    async def _handle_text_input(self, session_id: str, message_data: dict, ai_coordinator) -> AIResponseMessage:
+    async def _handle_text_input(self, session_id: str, text_msg: TextInputMessage, ai_coordinator) -> AIResponseMessage:
         """Handle text input message"""
         try:
-            text_msg = TextInputMessage(**message_data)
-            
-            # Get interview session
-            session = self.interview_sessions.get(session_id)
-            if not session:
-                raise ValueError("Interview session not found")
-            
-            # Prepare input data
-            input_data = {
-                "text": text_msg.get_text(),
-                "context": text_msg.get_context() or session.get_context(),
-                "original_question": "",  # Can be obtained from session
-                "interview_style": self.connection_info[session_id].interview_style
-            }
-            
-            # Call AI coordinator for processing
-            result = await ai_coordinator.process_unified_input(
-                input_data=input_data,
-                session_id=session_id
-            )
-            
-            # Update session records
-            if result.get("success", True):
-                session.add_ai_interaction(
-                    input_type=result["input_type"],
-                    user_input=result["user_input"],
-                    ai_response=result["ai_response"],
-                    processing_time=result.get("processing_time", 0.0),
-                    strategy_used=result.get("strategy_used", "unknown"),
-                    transcription_info=result.get("transcription_info")
-                )
-            
-            return AIResponseMessage(
-                session_id=session_id,
-                data={
-                    "user_input": result["user_input"],
-                    "ai_response": result["ai_response"],
-                    "response_type": result.get("response_type", "question"),
-                    "strategy_used": result.get("strategy_used", "unknown"),
-                    "focus_area": result.get("focus_area", "general"),
-                    "confidence": result.get("confidence", 0.5),
-                    "processing_time": result.get("processing_time", 0.0),
-                    "success": result.get("success", True)
-                }
+            return await self._run_unified_input(
+                session_id,
+                {"text": text_msg.get_text(), "context": text_msg.get_context()},
+                ai_coordinator
             )
         
         except Exception as e:
@@ -374,101 +558,281 @@ class ConnectionManager:
                 }
             )
     
-    async def _handle_audio_input(self, session_id: str, message_data: dict, ai_coordinator) -> AIResponseMessage:
+    async def _handle_audio_input(self, session_id: str, audio_msg: AudioInputMessage, ai_coordinator) -> AIResponseMessage:
         """Handle audio input message"""
+        return await self._process_audio(
+            session_id,
+            audio_msg.get_audio_data(),
+            audio_msg.get_audio_format(),
+            audio_msg.get_context(),
+            ai_coordinator
+        )
+    
+    async def _process_audio(self, session_id: str, audio_data: bytes, audio_format: str, context: str, ai_coordinator) -> AIResponseMessage:
+        """Transcribe a complete utterance and run it through the unified AI workflow"""
         try:
-            audio_msg = AudioInputMessage(**message_data)
-            
-            # Get audio data
-            audio_data = audio_msg.get_audio_data()
             if not audio_data:
                 raise ValueError("No audio data provided")
             
-            # Get interview session
-            session = self.interview_sessions.get(session_id)
-            if not session:
-                raise ValueError("Interview session not found")
-            
-            # Prepare input data
-            input_data = {
-                "audio_content": audio_data,
-                "audio_format": audio_msg.get_audio_format(),
-                "context": audio_msg.get_context() or session.get_context(),
-                "original_question": "",  # Can be obtained from session
-                "interview_style": self.connection_info[session_id].interview_style
+            return await self._run_unified_input(
+                session_id,
+                {"audio_content": audio_data, "audio_format": audio_format, "context": context},
+                ai_coordinator
+            )
+        
+        except Exception as e:
+            logger.error(f"Error handling audio input: {e}")
+            return ErrorMessage(
+                session_id=session_id,
+                data={
+                    "error": "audio_processing_error",
+                    "message": "Failed to process audio input",
+                    "details": str(e)
+                }
+            )
+    
+    async def _run_unified_input(self, session_id: str, input_data: Dict[str, Any], ai_coordinator) -> AIResponseMessage:
+        """
+        Common text/audio path: run input through the unified AI workflow and record it on the session
+        input_data holds the input-specific fields; context, question and style are filled in here
+        """
+        # Get interview session - the AI call below runs without the session lock
+        session = await session_cache.get(session_id)
+        if not session:
+            raise ValueError("Interview session not found")
+        
+        connection = self.connection_info.get(session_id)
+        input_data["context"] = input_data.get("context") or session.get_context()
+        input_data["original_question"] = ""  # Can be obtained from session
+        input_data["interview_style"] = connection.interview_style if connection else "formal"
+        
+        # Call AI coordinator for processing
+        result = await ai_coordinator.process_unified_input(
+            input_data=input_data,
+            session_id=session_id
+        )
+        
+        # Update session records (re-read under the lock so concurrent updates aren't lost)
+        if result.get("success", True):
+            async with session_cache.update(session_id) as session:
+                if session is not None:
+                    session.add_ai_interaction(
+                        input_type=result["input_type"],
+                        user_input=result["user_input"],
+                        ai_response=result["ai_response"],
+                        processing_time=result.get("processing_time", 0.0),
+                        strategy_used=result.get("strategy_used", "unknown"),
+                        transcription_info=result.get("transcription_info")
+                    )
+        
+        return AIResponseMessage(
+            session_id=session_id,
+            data={
+                "user_input": result["user_input"],
+                "ai_response": result["ai_response"],
+                "response_type": result.get("response_type", "question"),
+                "strategy_used": result.get("strategy_used", "unknown"),
+                "focus_area": result.get("focus_area", "general"),
+                "confidence": result.get("confidence", 0.5),
+                "processing_time": result.get("processing_time", 0.0),
+                "transcription_info": result.get("transcription_info"),
+                "success": result.get("success", True)
             }
-            
-            # Call AI coordinator for processing
-            result = await ai_coordinator.process_unified_input(
-                input_data=input_data,
-                session_id=session_id
+        )
+    
+    # ==========================================================================
+    # Streaming audio
+    # ==========================================================================
+    
+    def start_audio_stream(self, session_id: str, audio_format: str = "webm", context: str = "") -> AudioStream:
+        """Begin a new streamed utterance on the main socket, dropping any unfinished one"""
+        self.discard_audio_stream(session_id)
+        stream = self.new_audio_stream(session_id, session_id, audio_format, context)
+        self.audio_streams[session_id] = stream
+        logger.debug(f"[{session_id}] Audio stream started ({audio_format})")
+        return stream
+    
+    def new_audio_stream(self, connection_id: str, session_id: str, audio_format: str = "webm", context: str = "") -> AudioStream:
+        """Utterance whose partials go through the connection's outbound queue like every other frame"""
+        return AudioStream(session_id, lambda text: self._send_raw(connection_id, text), audio_format, context)
+    
+    def handle_binary(self, session_id: str, frame: bytes, ai_coordinator) -> Optional[WebSocketMessage]:
+        """
+        Handle a binary frame: 1-byte opcode + raw payload (no base64, no JSON)
+        
+        Returns:
+            Optional[WebSocketMessage]: Error message if the frame was rejected
+        """
+        self.record_received(session_id)
+        
+        if not frame:
+            return None
+        
+        opcode = frame[0]
+        payload = memoryview(frame)[1:]
+        
+        if opcode == WebSocketOpcode.AUDIO_FRAME:
+            return self.push_audio_frame(session_id, payload, ai_coordinator)
+        
+        self.stats.errors_count += 1
+        logger.warning(f"Unknown binary opcode from {session_id}: {opcode:#04x}")
+        return ErrorMessage(
+            session_id=session_id,
+            data={
+                "error": "unknown_opcode",
+                "message": f"Unknown binary frame opcode: {opcode:#04x}"
+            }
+        )
+    
+    def push_audio_frame(self, session_id: str, frame: bytes, ai_coordinator) -> Optional[WebSocketMessage]:
+        """
+        Append an audio frame to the main socket's utterance
+        
+        Returns:
+            Optional[WebSocketMessage]: Error message if the frame was rejected
+        """
+        stream = self.audio_streams.get(session_id)
+        error = self.append_audio_frame(session_id, stream, frame, ai_coordinator)
+        if error is not None and stream is not None:
+            self.discard_audio_stream(session_id)
+        return error
+    
+    def append_audio_frame(self, session_id: str, stream: Optional[AudioStream], frame: bytes, ai_coordinator) -> Optional[WebSocketMessage]:
+        """
+        Append an audio frame to an utterance
+        Schedules a background partial transcription when one is due; on error the caller drops the stream
+        
+        Returns:
+            Optional[WebSocketMessage]: Error message if the frame was rejected
+        """
+        if stream is None:
+            return ErrorMessage(
+                session_id=session_id,
+                data={
+                    "error": "audio_stream_not_started",
+                    "message": "Send audio_start before audio frames"
+                }
             )
-            
-            # Update session records
-            if result.get("success", True):
-                session.add_ai_interaction(
-                    input_type=result["input_type"],
-                    user_input=result["user_input"],
-                    ai_response=result["ai_response"],
-                    processing_time=result.get("processing_time", 0.0),
-                    strategy_used=result.get("strategy_used", "unknown"),
-                    transcription_info=result.get("transcription_info")
+        
+        if len(stream.buffer) + len(frame) > settings.MAX_AUDIO_SIZE:
+            return ErrorMessage(
+                session_id=session_id,
+                data={
+                    "error": "audio_too_large",
+                    "message": f"Streamed audio exceeds {settings.MAX_AUDIO_SIZE} bytes"
+                }
+            )
+        
+        stream.append(frame)
+        
+        # Partials are best-effort: skip this one while every partial slot is busy
+        if stream.partial_due() and not self._partial_slots.locked():
+            stream.partial_task = asyncio.create_task(self._emit_partial_transcript(stream, ai_coordinator))
+        return None
+    
+    async def _emit_partial_transcript(self, stream: AudioStream, ai_coordinator):
+        """Transcribe the audio received since the last partial and push the running transcript"""
+        stream.last_partial_at = time.monotonic()
+        frame_count = stream.frame_count
+        window = stream.take_partial_window()
+        try:
+            # Throwaway audio: bounded across all streams and kept out of the transcription cache
+            async with self._partial_slots:
+                result = await ai_coordinator.transcribe_audio(
+                    audio_content=window,
+                    audio_format=stream.audio_format,
+                    session_id=stream.session_id,
+                    cache=False
                 )
+            text = result.get("transcription", "")
+            if not result.get("success") or not text:
+                return
+            stream.partial_text = f"{stream.partial_text} {text}".lstrip()
             
-            return AIResponseMessage(
-                session_id=session_id,
+            message = TranscriptionMessage(
+                session_id=stream.session_id,
                 data={
-                    "user_input": result["user_input"],
-                    "ai_response": result["ai_response"],
-                    "response_type": result.get("response_type", "question"),
-                    "strategy_used": result.get("strategy_used", "unknown"),
-                    "focus_area": result.get("focus_area", "general"),
-                    "confidence": result.get("confidence", 0.5),
-                    "processing_time": result.get("processing_time", 0.0),
-                    "transcription_info": result.get("transcription_info"),
-                    "success": result.get("success", True)
+                    "text": stream.partial_text,
+                    "is_partial": True,
+                    "frames": frame_count
                 }
             )
+            await stream.send(message.to_wire().decode("utf-8"))
         
+        except asyncio.CancelledError:
+            raise
         except Exception as e:
-            logger.error(f"Error handling audio input: {e}")
+            logger.warning(f"[{stream.session_id}] Partial transcription failed: {e}")
+    
+    async def finish_audio_stream(self, session_id: str, ai_coordinator) -> WebSocketMessage:
+        """Close the main socket's utterance and run the full audio through the AI workflow"""
+        return await self.process_audio_stream(session_id, self.audio_streams.pop(session_id, None), ai_coordinator)
+    
+    async def process_audio_stream(self, session_id: str, stream: Optional[AudioStream], ai_coordinator) -> WebSocketMessage:
+        """Run a detached utterance through the AI workflow"""
+        if stream is None:
             return ErrorMessage(
                 session_id=session_id,
                 data={
-                    "error": "audio_processing_error",
-                    "message": "Failed to process audio input",
-                    "details": str(e)
+                    "error": "audio_stream_not_started",
+                    "message": "No audio stream in progress"
                 }
             )
+        
+        stream.cancel_partial()
+        logger.debug(f"[{session_id}] Audio stream finished: {stream.frame_count} frames, {len(stream.buffer)} bytes")
+        return await self._process_audio(
+            session_id, bytes(stream.buffer), stream.audio_format, stream.context, ai_coordinator
+        )
+    
+    def discard_audio_stream(self, session_id: str):
+        """Drop the main socket's unfinished utterance"""
+        stream = self.audio_streams.pop(session_id, None)
+        if stream is not None:
+            stream.cancel_partial()
     
     async def _cleanup_connection(self, session_id: str):
         """Clean up connection resources"""
         try:
+            # Stop the writer first so it can't race the close; unsent frames have nowhere to go
+            self._stop_writer(session_id)
+            
             # Close WebSocket connection
             if session_id in self.active_connections:
-                websocket = self.active_connections[session_id]
-                try:
-                    await websocket.close()
-                except:
-                    pass  # Connection may already be closed
-                del self.active_connections[session_id]
+                websocket = self.active_connections.pop(session_id)
+                self._active_sessions_cache = None
+                await self._close_socket(websocket)
+            elif session_id in self.audio_connections:
+                await self._close_socket(self.audio_connections.pop(session_id))
+            
+            # Drop any unfinished streamed utterance
+            self.discard_audio_stream(session_id)
             
             # Update connection info
             if session_id in self.connection_info:
                 self.connection_info[session_id].is_active = False
                 # Note: Don't delete connection_info, keep for statistics and debugging
             
-            # Note: Don't delete interview_sessions, maintain session memory
+            # Note: Don't delete the interview session, it expires from the session cache
             # This way session data is preserved even if connection drops
             
             # Update statistics
-            self.stats.active_connections = len(self.active_connections)
+            self.stats.active_connections = len(self.active_connections) + len(self.audio_connections)
             
             logger.info(f"Connection cleaned up: {session_id}")
             
         except Exception as e:
             logger.error(f"Error cleaning up connection {session_id}: {e}")
     
+    @staticmethod
+    async def _close_socket(websocket: WebSocket):
+        """Close a socket unless the client already disconnected (the normal path)"""
+        if websocket.client_state != WebSocketState.DISCONNECTED:
+            try:
+                await websocket.close()
+            except Exception:
+                pass  # Connection may already be closed
+    
     async def _heartbeat_loop(self):
         """Heartbeat check loop"""
         while True:
@@ -476,17 +840,23 @@ class ConnectionManager:
                 await asyncio.sleep(30)  # Check every 30 seconds
                 
                 current_time = datetime.now()
-                inactive_sessions = []
-                
-                for session_id, info in self.connection_info.items():
-                    if info.is_active:
-                        # Check if inactive for more than 5 minutes
-                        inactive_duration = (current_time - info.last_activity).total_seconds()
-                        if inactive_duration > 300:  # 5 minutes
-                            inactive_sessions.append(session_id)
+                now = time.monotonic()
                 
-                # Clean up inactive connections
-                for session_id in inactive_sessions:
+                # Only look at connections whose deadline has passed, not every connection
+                while self._idle_heap and self._idle_heap[0][0] <= now:
+                    _, session_id = heapq.heappop(self._idle_heap)
+                    info = self.connection_info.get(session_id)
+                    if info is None or not info.is_active:
+                        self._idle_scheduled.discard(session_id)
+                        continue  # Already disconnected
+                    
+                    deadline = info.last_activity + IDLE_TIMEOUT
+                    if deadline > now:
+                        # Active since the entry was pushed - check again at the new deadline
+                        heapq.heappush(self._idle_heap, (deadline, session_id))
+                        continue
+                    
+                    self._idle_scheduled.discard(session_id)
                     logger.info(f"Cleaning up inactive connection: {session_id}")
                     await self._cleanup_connection(session_id)
                 
@@ -500,12 +870,46 @@ class ConnectionManager:
         """Get connection statistics"""
         current_time = datetime.now()
         self.stats.uptime_seconds = (current_time - self.start_time).total_seconds()
-        self.stats.active_connections = len(self.active_connections)
+        self.stats.active_connections = len(self.active_connections) + len(self.audio_connections)
         return self.stats
     
+    def get_stats_snapshot(self) -> Dict[str, Any]:
+        """Stats payload for monitoring endpoints, recomputed at most once per STATS_CACHE_TTL"""
+        now = time.monotonic()
+        if self._stats_cache is None or now - self._stats_cache[0] >= STATS_CACHE_TTL:
+            self._stats_cache = (now, {
+                "websocket_stats": asdict(self.get_connection_stats()),
+                "active_sessions": self.get_active_sessions()
+            })
+        return self._stats_cache[1]
+    
     def get_active_sessions(self) -> List[str]:
-        """Get list of all active Session IDs"""
-        return list(self.active_connections.keys())
+        """Get list of all active Session IDs (shared snapshot - don't mutate)"""
+        if self._active_sessions_cache is None:
+            self._active_sessions_cache = list(self.active_connections)
+        return self._active_sessions_cache
+    
+    def get_session_details(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """Serialized connection info, only re-formatted when the connection's state changes"""
+        info = self.connection_info.get(session_id)
+        if info is None:
+            return None
+        
+        # Activity is compared at one-second resolution, so chatty sessions aren't re-formatted per message
+        key = (int(info.last_activity), info.is_active, info.interview_style)
+        cached = self._session_details_cache.get(session_id)
+        if cached is None or cached[0] != key:
+            cached = (key, {
+                "session_id": info.session_id,
+                "client_address": info.client_address,
+                "connected_at": info.connected_at_iso,
+                # last_activity is monotonic - convert to wall-clock time only when reported
+                "last_activity": (datetime.now() - timedelta(seconds=time.monotonic() - info.last_activity)).isoformat(),
+                "interview_style": info.interview_style,
+                "is_active": info.is_active
+            })
+            self._session_details_cache[session_id] = cached
+        return cached[1]
     
     def get_session_info(self, session_id: str) -> Optional[ConnectionInfo]:
         """Get connection info for specified session"""
@@ -1,6 +1,6 @@
 import os
 from dotenv import load_dotenv
-from typing import List
+from typing import FrozenSet
 
 load_dotenv()
 
@@ -13,12 +13,23 @@ class Settings:
     OPENAI_API_KEY: str = os.getenv("OPENAI_API_KEY", "")
     OPENAI_MODEL_GPT: str = os.getenv("MODEL_NAME", os.getenv("OPENAI_MODEL_GPT", "gpt-3.5-turbo"))
     OPENAI_MODEL_WHISPER: str = os.getenv("OPENAI_MODEL_WHISPER", "whisper-1")
+    WHISPER_MAX_CONNECTIONS: int = int(os.getenv("WHISPER_MAX_CONNECTIONS", "32"))
+    WHISPER_TIMEOUT: float = float(os.getenv("WHISPER_TIMEOUT", "60"))
+    WHISPER_MAX_CONCURRENCY: int = int(os.getenv("WHISPER_MAX_CONCURRENCY", "8"))
+    TRANSCRIPTION_CACHE_SIZE: int = int(os.getenv("TRANSCRIPTION_CACHE_SIZE", "256"))  # 0 = disabled
+    STREAM_PARTIAL_INTERVAL: float = float(os.getenv("STREAM_PARTIAL_INTERVAL", "1.5"))  # Seconds between partial transcripts on /ws/{id}/audio
+    WS_PARTIAL_MAX_CONCURRENCY: int = int(os.getenv("WS_PARTIAL_MAX_CONCURRENCY", "8"))  # Partial transcriptions in flight across all streams
+    WS_MESSAGE_QUEUE_SIZE: int = int(os.getenv("WS_MESSAGE_QUEUE_SIZE", "32"))  # Pending AI-backed messages per WebSocket
+    WS_OUTBOUND_QUEUE_SIZE: int = int(os.getenv("WS_OUTBOUND_QUEUE_SIZE", "128"))  # Unsent frames per WebSocket before it is dropped as too slow
+    MAX_CONCURRENT_AI: int = int(os.getenv("MAX_CONCURRENT_AI", "64"))  # AI-backed HTTP requests in flight across all sessions
+    AI_ADMISSION_TIMEOUT: float = float(os.getenv("AI_ADMISSION_TIMEOUT", "5"))  # Seconds to wait for an AI slot before 503
+    THREAD_POOL_SIZE: int = int(os.getenv("THREAD_POOL_SIZE", "200"))  # anyio worker threads for sync endpoints / UploadFile I/O
     
     # CORS Configuration
-    ALLOWED_ORIGINS: List[str] = os.getenv(
+    ALLOWED_ORIGINS: FrozenSet[str] = frozenset(os.getenv(
         "ALLOWED_ORIGINS", 
         "http://localhost:3000,http://127.0.0.1:3000"
-    ).split(",")
+    ).split(","))  # CORSMiddleware checks `origin in allow_origins` per request
     
     # Interview Configuration
     MAX_QUESTIONS: int = int(os.getenv("MAX_QUESTIONS", "3"))
@@ -26,7 +37,14 @@ class Settings:
     
     # Audio Configuration
     MAX_AUDIO_SIZE: int = int(os.getenv("MAX_AUDIO_SIZE", "25000000"))  # 25MB
-    SUPPORTED_AUDIO_FORMATS: List[str] = ["wav", "mp3", "m4a", "webm"]
+    SUPPORTED_AUDIO_FORMATS: FrozenSet[str] = frozenset({"wav", "mp3", "m4a", "webm"})  # O(1) membership checks
+    
+    # Session Memory Configuration
+    REDIS_URL: str = os.getenv("REDIS_URL", "")  # Empty = in-process memory
+    SESSION_MEMORY_TTL: int = int(os.getenv("SESSION_MEMORY_TTL", "3600"))  # seconds
+    SESSION_MEMORY_MAX_SESSIONS: int = int(os.getenv("SESSION_MEMORY_MAX_SESSIONS", "1000"))
+    SESSION_CACHE_TTL: int = int(os.getenv("SESSION_CACHE_TTL", "3600"))  # Idle seconds before an interview session expires
+    SESSION_CACHE_MAX_SESSIONS: int = int(os.getenv("SESSION_CACHE_MAX_SESSIONS", "10000"))
     
     # Environment
     ENVIRONMENT: str = os.getenv("ENVIRONMENT", "development")
@@ -0,0 +1,182 @@
+"""
+Interview session storage shared by the HTTP and WebSocket APIs
+Pluggable strategy: bounded in-process LRU by default, Redis when REDIS_URL is set
+"""
+
+import asyncio
+import json
+import logging
+import time
+import weakref
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional, Tuple
+
+from .config import settings
+from .utils import InterviewSession
+
+try:
+    import redis.asyncio as aioredis
+except ImportError:  # Redis backend is optional
+    aioredis = None
+
+logger = logging.getLogger(__name__)
+
+# Cross-worker session lock (Redis backend): auto-expiry so a crashed worker can't wedge a
+# session, and how long update() waits for another worker before giving up
+REDIS_LOCK_TIMEOUT = 10.0
+REDIS_LOCK_WAIT = 5.0
+
+class SessionCacheStrategy(ABC):
+    """
+    Session store interface - callers must `set` a session again after mutating it
+    Use `update(session_id)` for get -> mutate -> set so concurrent requests don't lose updates;
+    keep slow work (AI calls) outside it
+    """
+
+    def __init__(self):
+        # One lock per session, dropped once nobody holds or waits on it
+        self._locks: "weakref.WeakValueDictionary[str, asyncio.Lock]" = weakref.WeakValueDictionary()
+
+    def lock(self, session_id: str) -> asyncio.Lock:
+        """Process-local lock for one session (not reentrant)"""
+        lock = self._locks.get(session_id)
+        if lock is None:
+            lock = self._locks[session_id] = asyncio.Lock()
+        return lock
+
+    @asynccontextmanager
+    async def update(self, session_id: str) -> AsyncIterator[Optional[InterviewSession]]:
+        """Locked read-modify-write: yields the live session (None if missing) and stores it back on exit"""
+        async with self.lock(session_id):
+            session = await self.get(session_id)
+            yield session
+            if session is not None:
+                await self.set(session_id, session)
+
+    @abstractmethod
+    async def get(self, session_id: str) -> Optional[InterviewSession]:
+        """Get a live session, or None if missing/expired"""
+
+    @abstractmethod
+    async def set(self, session_id: str, session: InterviewSession):
+        """Store a session and refresh its TTL"""
+
+    @abstractmethod
+    async def delete(self, session_id: str):
+        """Remove a session"""
+
+    @abstractmethod
+    async def touch(self, session_id: str, ttl: Optional[int] = None):
+        """Extend a session's TTL without rewriting it"""
+
+class InMemoryLRU(SessionCacheStrategy):
+    """
+    Process-local session cache
+    Bounded by session count (LRU eviction) and idle TTL; stores live objects, no serialization
+    """
+
+    def __init__(self, max: int = 10_000, ttl: int = 3600):
+        super().__init__()
+        self.max = max
+        self.ttl = ttl
+        # session_id -> (expires_at, session)
+        self._sessions: "OrderedDict[str, Tuple[float, InterviewSession]]" = OrderedDict()
+
+    async def get(self, session_id: str) -> Optional[InterviewSession]:
+        item = self._sessions.get(session_id)
+        if item is None:
+            return None
+        expires_at, session = item
+        if expires_at < time.monotonic():
+            del self._sessions[session_id]
+            return None
+        self._sessions.move_to_end(session_id)
+        return session
+
+    async def set(self, session_id: str, session: InterviewSession):
+        self._sessions[session_id] = (time.monotonic() + self.ttl, session)
+        self._sessions.move_to_end(session_id)
+
+        # Evict least recently used sessions
+        while len(self._sessions) > self.max:
+            evicted_id, _ = self._sessions.popitem(last=False)
+            logger.info(f"Interview session evicted (LRU): {evicted_id}")
+
+    async def delete(self, session_id: str):
+        self._sessions.pop(session_id, None)
+
+    async def touch(self, session_id: str, ttl: Optional[int] = None):
+        item = self._sessions.get(session_id)
+        if item is not None:
+            self._sessions[session_id] = (time.monotonic() + (ttl or self.ttl), item[1])
+            self._sessions.move_to_end(session_id)
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+class RedisSessionCache(SessionCacheStrategy):
+    """
+    Redis-backed session cache shared across workers
+    Sessions are stored as JSON under `interview_session:{id}` with a sliding TTL;
+    `update` also takes a Redis lock so read-modify-writes from different workers don't interleave
+    """
+
+    def __init__(self, url: str, ttl: int = 3600):
+        if aioredis is None:
+            raise ImportError("redis package is required for RedisSessionCache")
+        super().__init__()
+        self.redis = aioredis.Redis.from_url(url, decode_responses=True)
+        self.ttl = ttl
+
+    @staticmethod
+    def _key(session_id: str) -> str:
+        return f"interview_session:{session_id}"
+
+    @asynccontextmanager
+    async def update(self, session_id: str) -> AsyncIterator[Optional[InterviewSession]]:
+        """
+        Read-modify-write under the process-local lock (queues this worker's callers) and a
+        Redis lock (SET NX with an owner token, released by compare-and-delete) for other workers
+        Raises redis LockError if another worker holds the session for longer than REDIS_LOCK_WAIT
+        """
+        async with self.lock(session_id):
+            async with self.redis.lock(
+                f"{self._key(session_id)}:lock", timeout=REDIS_LOCK_TIMEOUT, blocking_timeout=REDIS_LOCK_WAIT
+            ):
+                session = await self.get(session_id)
+                yield session
+                if session is not None:
+                    await self.set(session_id, session)
+
+    async def get(self, session_id: str) -> Optional[InterviewSession]:
+        raw = await self.redis.get(self._key(session_id))
+        if raw is None:
+            return None
+        return InterviewSession.from_dict(json.loads(raw))
+
+    async def set(self, session_id: str, session: InterviewSession):
+        await self.redis.set(self._key(session_id), json.dumps(session.to_dict(), default=str), ex=self.ttl)
+
+    async def delete(self, session_id: str):
+        await self.redis.delete(self._key(session_id))
+
+    async def touch(self, session_id: str, ttl: Optional[int] = None):
+        await self.redis.expire(self._key(session_id), ttl or self.ttl)
+
+def create_session_cache() -> SessionCacheStrategy:
+    """Create session cache backend based on configuration"""
+    if settings.REDIS_URL:
+        try:
+            cache = RedisSessionCache(settings.REDIS_URL, ttl=settings.SESSION_CACHE_TTL)
+            logger.info("Session cache backend: Redis")
+            return cache
+        except ImportError as e:
+            logger.warning(f"Redis session cache unavailable, falling back to in-process LRU: {e}")
+
+    logger.info("Session cache backend: in-process LRU")
+    return InMemoryLRU(max=settings.SESSION_CACHE_MAX_SESSIONS, ttl=settings.SESSION_CACHE_TTL)
+
+# Global session cache instance
+session_cache = create_session_cache()
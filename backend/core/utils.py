@@ -1,88 +1,151 @@
 import asyncio
 import tempfile
+import time
 import os
 import logging
-from typing import Optional, Dict, Any
-from datetime import datetime
-import uuid
+from collections import deque
+from dataclasses import asdict, dataclass
+from itertools import islice
+from typing import Optional, Dict, Any, Deque
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Cached (second, "YYYY-MM-DDTHH:MM:SS") so message timestamps only format the date once per second
+_iso_second_cache = (None, "")
+
+def iso_now() -> str:
+    """Local-time ISO 8601 timestamp with microseconds (same format as datetime.now().isoformat())"""
+    global _iso_second_cache
+    now = time.time()
+    second = int(now)
+    cached_second, prefix = _iso_second_cache
+    if second != cached_second:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(second))
+        _iso_second_cache = (second, prefix)
+    return f"{prefix}.{int((now - second) * 1_000_000):06d}"
+
+# AI interactions kept per session - context only ever looks at the last few
+RECENT_AI_INTERACTIONS = 16
+
+@dataclass(slots=True)
+class AIInteraction:
+    """One recorded AI exchange (slotted - sessions keep the last RECENT_AI_INTERACTIONS of them)"""
+    timestamp: str
+    input_type: str
+    user_input: str
+    ai_response: str
+    processing_time: float
+    strategy_used: str = "unknown"
+    transcription_info: Optional[Dict[str, Any]] = None
+
 class InterviewSession:
     """Manage interview session state (enhanced version)"""
+    
+    # Slotted - the session cache holds thousands of these, no per-instance __dict__
+    __slots__ = (
+        "session_id", "created_at", "created_at_monotonic", "last_activity", "current_question_index",
+        "question_ids", "questions", "answers", "followups", "input_types", "answer_timestamps",
+        "response_count", "followup_count", "ai_interactions", "ai_interaction_count", "_context_cache",
+        "is_completed", "interview_style", "session_metadata", "role", "initialized_at"
+    )
+    
     def __init__(self, session_id: str = None):
-        self.session_id = session_id or str(uuid.uuid4())
-        self.created_at = datetime.now()
-        self.last_activity = datetime.now()
+        self.session_id = session_id or uuid4().hex
+        self.created_at = datetime.now(timezone.utc)
+        self.created_at_monotonic = time.monotonic()  # Duration clock, immune to wall-clock jumps
+        self.last_activity = datetime.now(timezone.utc)
         self.current_question_index = 0
-        self.conversation_history = []
-        self.user_responses = []
-        self.followup_questions = []
-        self.ai_interactions = []  # Record all AI interactions
+        # Answers stored as parallel arrays (one slot per answer)
+        self.question_ids = []
+        self.questions = []
+        self.answers = []
+        self.followups = []  # Follow-up asked after each answer, None if none
+        self.input_types = []
+        self.answer_timestamps = []
+        self.response_count = 0
+        self.followup_count = 0
+        self.ai_interactions: Deque[AIInteraction] = deque(maxlen=RECENT_AI_INTERACTIONS)  # Most recent AI interactions
+        self.ai_interaction_count = 0  # All interactions ever recorded
+        self._context_cache = None  # (interaction count, max_interactions, context) - rebuilt when interactions change
         self.is_completed = False
         self.interview_style = "formal"
         self.session_metadata = {}  # Store additional session information
+        self.role = None
+        self.initialized_at = None
         
-    def add_response(self, question_id: int, question: str, answer: str, followup: str = None):
+    def add_response(self, question_id: int, question: str, answer: str, followup: str = None,
+                     input_type: str = "text"):
         """Add user answer and follow-up question"""
-        self.last_activity = datetime.now()
-        
-        response_data = {
-            "question_id": question_id,
-            "question": question,
-            "answer": answer,
-            "followup": followup,
-            "timestamp": datetime.now().isoformat(),
-            "input_type": "text"  # Default to text, can be specified when calling
-        }
-        self.user_responses.append(response_data)
+        now = datetime.now(timezone.utc)
+        self.last_activity = now
         
-        # Update conversation history for AI context
-        self.conversation_history.append({
-            "question": question,
-            "answer": answer,
-            "timestamp": datetime.now().isoformat()
-        })
+        self.question_ids.append(question_id)
+        self.questions.append(question)
+        self.answers.append(answer)
+        self.followups.append(followup)
+        self.input_types.append(input_type)
+        self.answer_timestamps.append(now.isoformat())
+        self.response_count += 1
         if followup:
-            self.followup_questions.append({
-                "question": followup,
-                "timestamp": datetime.now().isoformat()
-            })
+            self.followup_count += 1
+    
+    def set_last_followup(self, followup: str) -> bool:
+        """Attach a follow-up question to the most recent answer"""
+        if not self.response_count:
+            return False
+        self.followups[-1] = followup
+        self.followup_count += 1
+        self.last_activity = datetime.now(timezone.utc)
+        return True
+    
+    def responses_summary(self) -> Dict[str, list]:
+        """Answers as column arrays (serialized as-is, no per-answer dicts)"""
+        return {
+            "question_ids": self.question_ids,
+            "questions": self.questions,
+            "answers": self.answers,
+            "followups": self.followups,
+            "input_types": self.input_types,
+            "timestamps": self.answer_timestamps
+        }
     
     def add_ai_interaction(self, input_type: str, user_input: str, ai_response: str, 
                           processing_time: float, strategy_used: str = "unknown",
                           transcription_info: Dict = None):
         """Record AI interaction"""
-        self.last_activity = datetime.now()
+        self.last_activity = datetime.now(timezone.utc)
         
-        interaction = {
-            "timestamp": datetime.now().isoformat(),
-            "input_type": input_type,
-            "user_input": user_input,
-            "ai_response": ai_response,
-            "processing_time": processing_time,
-            "strategy_used": strategy_used
-        }
-        
-        if transcription_info:
-            interaction["transcription_info"] = transcription_info
-            
-        self.ai_interactions.append(interaction)
+        self.ai_interactions.append(AIInteraction(
+            timestamp=self.last_activity.isoformat(),
+            input_type=input_type,
+            user_input=user_input,
+            ai_response=ai_response,
+            processing_time=processing_time,
+            strategy_used=strategy_used,
+            transcription_info=transcription_info or None
+        ))
+        self.ai_interaction_count += 1
+        self._context_cache = None
     
     def get_context(self, max_interactions: int = 3) -> str:
-        """Get conversation context for AI processing (enhanced version)"""
-        context = ""
+        """Get conversation context for AI processing (enhanced version, memoized per interaction count)"""
+        cache = self._context_cache
+        if cache is not None and cache[0] == self.ai_interaction_count and cache[1] == max_interactions:
+            return cache[2]
         
         # Use recent AI interaction records
-        recent_interactions = self.ai_interactions[-max_interactions:]
+        recent_interactions = islice(self.ai_interactions, max(len(self.ai_interactions) - max_interactions, 0), None)
         
-        for interaction in recent_interactions:
-            context += f"User: {interaction['user_input']}\n"
-            context += f"AI: {interaction['ai_response']}\n\n"
-        
-        return context.strip()
+        context = "\n\n".join(
+            f"User: {interaction.user_input}\nAI: {interaction.ai_response}"
+            for interaction in recent_interactions
+        ).strip()
+        self._context_cache = (self.ai_interaction_count, max_interactions, context)
+        return context
     
     def get_full_context(self) -> Dict[str, Any]:
         """Get complete session context information"""
@@ -90,8 +153,8 @@ class InterviewSession:
             "session_id": self.session_id,
             "created_at": self.created_at.isoformat(),
             "last_activity": self.last_activity.isoformat(),
-            "duration": str(datetime.now() - self.created_at),
-            "total_interactions": len(self.ai_interactions),
+            "duration": str(self.duration()),
+            "total_interactions": self.ai_interaction_count,
             "current_question_index": self.current_question_index,
             "interview_style": self.interview_style,
             "is_completed": self.is_completed,
@@ -99,47 +162,97 @@ class InterviewSession:
             "session_metadata": self.session_metadata
         }
     
+    def to_dict(self) -> Dict[str, Any]:
+        """Serializable session state (for external session stores)"""
+        return {
+            "session_id": self.session_id,
+            "created_at": self.created_at.isoformat(),
+            "last_activity": self.last_activity.isoformat(),
+            "current_question_index": self.current_question_index,
+            "responses": self.responses_summary(),
+            "followup_count": self.followup_count,
+            "ai_interactions": [asdict(interaction) for interaction in self.ai_interactions],
+            "ai_interaction_count": self.ai_interaction_count,
+            "is_completed": self.is_completed,
+            "interview_style": self.interview_style,
+            "session_metadata": self.session_metadata,
+            "role": self.role,
+            "initialized_at": self.initialized_at
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "InterviewSession":
+        """Rebuild a session from `to_dict` output"""
+        session = cls(data["session_id"])
+        session.created_at = datetime.fromisoformat(data["created_at"])
+        # Monotonic clocks aren't comparable across processes - re-anchor from the wall-clock age
+        session.created_at_monotonic = time.monotonic() - (datetime.now(timezone.utc) - session.created_at).total_seconds()
+        session.last_activity = datetime.fromisoformat(data["last_activity"])
+        session.current_question_index = data["current_question_index"]
+        responses = data["responses"]
+        session.question_ids = responses["question_ids"]
+        session.questions = responses["questions"]
+        session.answers = responses["answers"]
+        session.followups = responses["followups"]
+        session.input_types = responses["input_types"]
+        session.answer_timestamps = responses["timestamps"]
+        session.response_count = len(session.question_ids)
+        session.followup_count = data["followup_count"]
+        session.ai_interactions.extend(AIInteraction(**interaction) for interaction in data["ai_interactions"])
+        session.ai_interaction_count = data.get("ai_interaction_count", len(data["ai_interactions"]))
+        session.is_completed = data["is_completed"]
+        session.interview_style = data["interview_style"]
+        session.session_metadata = data["session_metadata"]
+        session.role = data.get("role")
+        session.initialized_at = data.get("initialized_at")
+        return session
+    
     def update_metadata(self, key: str, value: Any):
         """Update session metadata"""
         self.session_metadata[key] = value
-        self.last_activity = datetime.now()
+        self.last_activity = datetime.now(timezone.utc)
     
     def is_active(self, timeout_minutes: int = 30) -> bool:
         """Check if session is still active"""
-        time_since_activity = datetime.now() - self.last_activity
+        time_since_activity = datetime.now(timezone.utc) - self.last_activity
         return time_since_activity.total_seconds() < (timeout_minutes * 60)
     
     def next_question(self):
         """Move to next question"""
         self.current_question_index += 1
-        self.last_activity = datetime.now()
+        self.last_activity = datetime.now(timezone.utc)
+    
+    def duration(self) -> timedelta:
+        """Time since the session was created"""
+        return timedelta(seconds=time.monotonic() - self.created_at_monotonic)
     
     def complete(self):
         """Mark interview as completed"""
         self.is_completed = True
-        self.last_activity = datetime.now()
+        self.last_activity = datetime.now(timezone.utc)
 
 class AudioFileHandler:
     """Handle temporary storage and cleanup of audio files"""
     
+    @staticmethod
+    def _write_temp_audio(file_content: bytes, file_extension: str) -> str:
+        """Blocking temp file write (runs in a worker thread)"""
+        with tempfile.NamedTemporaryFile(delete=False, suffix=f'.{file_extension}') as temp_file:
+            temp_file.write(file_content)
+        return temp_file.name
+    
     @staticmethod
     async def save_temp_audio(file_content: bytes, file_extension: str = "wav") -> str:
         """Save temporary audio file"""
         try:
-            # Create temp file
-            temp_file = tempfile.NamedTemporaryFile(
-                delete=False, 
-                suffix=f'.{file_extension}'
-            )
-            temp_file.write(file_content)
-            temp_file.flush()
-            temp_file.close()
+            # Audio can be up to MAX_AUDIO_SIZE - keep the disk write off the event loop
+            file_name = await asyncio.to_thread(AudioFileHandler._write_temp_audio, file_content, file_extension)
             
-            logger.info(f"Temporary audio file saved: {temp_file.name}")
-            return temp_file.name
+            logger.info("Temporary audio file saved: %s", file_name)
+            return file_name
             
         except Exception as e:
-            logger.error(f"Failed to save temporary audio file: {e}")
+            logger.error("Failed to save temporary audio file: %s", e)
             raise
     
     @staticmethod
@@ -148,9 +261,9 @@ class AudioFileHandler:
         try:
             if os.path.exists(file_path):
                 os.unlink(file_path)
-                logger.info(f"Temporary file cleaned up: {file_path}")
+                logger.info("Temporary file cleaned up: %s", file_path)
         except Exception as e:
-            logger.error(f"Failed to cleanup temporary file {file_path}: {e}")
+            logger.error("Failed to cleanup temporary file %s: %s", file_path, e)
 
 class ResponseFormatter:
     """Format API responses"""
@@ -162,7 +275,7 @@ class ResponseFormatter:
             "status": "success",
             "message": message,
             "data": data,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": iso_now()
         }
     
     @staticmethod
@@ -173,7 +286,7 @@ class ResponseFormatter:
             "message": error,
             "error_code": code,
             "details": details,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": iso_now()
         }
 
 class AsyncTaskManager:
@@ -188,41 +301,57 @@ class AsyncTaskManager:
         try:
             return await asyncio.wait_for(coro, timeout=timeout)
         except asyncio.TimeoutError:
-            logger.error(f"Task timed out after {timeout} seconds")
+            logger.error("Task timed out after %s seconds", timeout)
             raise
         except Exception as e:
-            logger.error(f"Task failed: {e}")
+            logger.error("Task failed: %s", e)
             raise
     
-    async def run_concurrent(self, tasks: list, timeout: int = 30):
-        """Run multiple tasks concurrently"""
+    async def _guarded(self, coro):
+        """Run one task under the shared concurrency limit"""
         async with self._semaphore:
-            try:
-                # Use asyncio.gather for true concurrent execution
-                results = await asyncio.gather(*tasks, return_exceptions=True)
-                return results
-            except Exception as e:
-                logger.error(f"Concurrent tasks failed: {e}")
-                raise
+            return await coro
+    
+    async def run_concurrent(self, tasks: list, timeout: int = 30):
+        """Run multiple tasks concurrently (at most 15 at a time across all callers)"""
+        try:
+            # Semaphore is taken per task, so concurrent batches interleave instead of queueing whole
+            results = await asyncio.gather(*(self._guarded(task) for task in tasks), return_exceptions=True)
+            return results
+        except Exception as e:
+            logger.error("Concurrent tasks failed: %s", e)
+            raise
     
     async def run_parallel_tasks(self, task_dict: dict, timeout: int = 30):
-        """Run named task dictionary in parallel"""
+        """
+        Run named task dictionary in parallel
+        Returns {name: result or exception}; tasks still running at the timeout are cancelled and map to TimeoutError
+        """
         try:
-            # Create task list
-            tasks = []
-            task_names = []
-            for name, coro in task_dict.items():
-                tasks.append(asyncio.wait_for(coro, timeout=timeout))
-                task_names.append(name)
-            
-            # Execute concurrently
-            results = await asyncio.gather(*tasks, return_exceptions=True)
+            # One shared deadline for the whole batch - no per-coroutine wait_for timers
+            tasks = {name: asyncio.ensure_future(coro) for name, coro in task_dict.items()}
+            try:
+                if tasks:
+                    await asyncio.wait(tasks.values(), timeout=timeout)
+            finally:
+                # Stragglers (or everything, if the caller was cancelled) don't outlive the batch
+                timed_out = {name for name, task in tasks.items() if not task.done()}
+                for name in timed_out:
+                    tasks[name].cancel()
             
             # Return named results
-            return dict(zip(task_names, results))
+            results = {}
+            for name, task in tasks.items():
+                if name in timed_out:
+                    results[name] = asyncio.TimeoutError(f"Task '{name}' timed out after {timeout} seconds")
+                elif task.cancelled():
+                    results[name] = asyncio.CancelledError()
+                else:
+                    results[name] = task.exception() or task.result()
+            return results
             
         except Exception as e:
-            logger.error(f"Parallel tasks failed: {e}")
+            logger.error("Parallel tasks failed: %s", e)
             raise
 
 # Global instances
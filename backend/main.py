@@ -1,19 +1,30 @@
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
+import anyio.to_thread
+import asyncio
 import logging
+import logging.handlers
+import queue
+import time
 import uvicorn
 
 from core.config import settings
 from core.utils import ResponseFormatter
-from api_gateway.routes import router as api_router, http_exception_handler
+from api_gateway.routes import router as api_router, DefaultResponse, http_exception_handler, unhandled_exception_handler
+from api_gateway.websocket_manager import connection_manager
 from ai_backend.coordinator import AICoordinator
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+# Configure logging - handlers only enqueue records, a listener thread writes them to stderr,
+# so a slow log pipe never blocks the event loop (force replaces the handler core.utils installed)
+_log_handler = logging.StreamHandler()
+_log_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+_log_queue = queue.SimpleQueue()
+_log_listener = logging.handlers.QueueListener(_log_queue, _log_handler, respect_handler_level=True)
+_log_listener.start()
+_queue_handler = logging.handlers.QueueHandler(_log_queue)
+_queue_handler.setFormatter(logging.Formatter('%(message)s'))  # Final layout is applied by _log_handler
+logging.basicConfig(level=logging.INFO, handlers=[_queue_handler], force=True)
 logger = logging.getLogger(__name__)
 
 # Initialize FastAPI app
@@ -22,7 +33,8 @@ app = FastAPI(
     description="Modular AI-powered interview system with speech recognition, planning, and chatbot capabilities",
     version="2.0.0",
     docs_url="/docs" if settings.DEBUG else None,
-    redoc_url="/redoc" if settings.DEBUG else None
+    redoc_url="/redoc" if settings.DEBUG else None,
+    default_response_class=DefaultResponse
 )
 
 # Configure CORS middleware
@@ -37,6 +49,10 @@ app.add_middleware(
 # Global AI Coordinator instance
 ai_coordinator = None
 
+# Seconds a coordinator health result is reused - load balancer probes hit /health every few seconds
+HEALTH_CACHE_TTL = 2.0
+_last_health = (0.0, None)  # (monotonic time, coordinator health status)
+
 @app.on_event("startup")
 async def startup_event():
     """Application startup event"""
@@ -49,6 +65,14 @@ async def startup_event():
         settings.validate()
         logger.info("Configuration validated successfully")
         
+        # Size the anyio threadpool used by sync endpoints and UploadFile I/O
+        anyio.to_thread.current_default_thread_limiter().total_tokens = settings.THREAD_POOL_SIZE
+        
+        # Python 3.12+: tasks run their first step inline, so coroutines that finish without
+        # suspending (cache hits, quick checks) don't pay an event loop round-trip
+        if hasattr(asyncio, "eager_task_factory"):
+            asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+        
         # Initialize AI Coordinator
         ai_coordinator = AICoordinator()
         logger.info("AI Coordinator initialized")
@@ -56,6 +80,9 @@ async def startup_event():
         # Store AI coordinator in app state for access in routes
         app.state.ai_coordinator = ai_coordinator
         
+        # Warm up API connection pools (DNS + TLS) before the first request
+        await ai_coordinator.warmup()
+        
         # Perform health checks
         health_status = await ai_coordinator.health_check()
         if health_status["coordinator_status"] != "healthy":
@@ -74,11 +101,17 @@ async def shutdown_event():
     """Application shutdown event"""
     logger.info("Shutting down AI Interviewer Backend...")
     
-    # Cleanup resources if needed
-    # Note: Current implementation doesn't require explicit cleanup
-    # but this is where you would close database connections, etc.
+    # Close open WebSockets (main and audio sockets) before their dependencies go away
+    await connection_manager.close_all()
+    
+    # Close API connection pools
+    if ai_coordinator is not None:
+        await ai_coordinator.close()
     
     logger.info("AI Interviewer Backend shut down complete")
+    
+    # Flush queued log records
+    _log_listener.stop()
 
 # Include API routes
 app.include_router(
@@ -89,28 +122,32 @@ app.include_router(
 
 # Register exception handlers
 app.add_exception_handler(HTTPException, http_exception_handler)
+app.add_exception_handler(Exception, unhandled_exception_handler)
+
+# Service info payloads are constant - only the envelope timestamp is rendered per request
+_ROOT_INFO = {
+    "service": "AI Interviewer Backend",
+    "version": "2.0.0",
+    "status": "running",
+    "architecture": {
+        "api_gateway": "Frontend communication layer",
+        "ai_backend": {
+            "coordinator": "AI module orchestration", 
+            "speech_recognition": "Audio to text conversion",
+            "planner": "Response analysis and planning",
+            "chatbot": "Follow-up question generation"
+        }
+    },
+    "endpoints": {
+        "docs": "/docs" if settings.DEBUG else "disabled",
+        "api": "/api/v1"
+    }
+}
 
 @app.get("/")
 async def root():
     """Root path health check"""
-    return ResponseFormatter.success_response({
-        "service": "AI Interviewer Backend",
-        "version": "2.0.0",
-        "status": "running",
-        "architecture": {
-            "api_gateway": "Frontend communication layer",
-            "ai_backend": {
-                "coordinator": "AI module orchestration", 
-                "speech_recognition": "Audio to text conversion",
-                "planner": "Response analysis and planning",
-                "chatbot": "Follow-up question generation"
-            }
-        },
-        "endpoints": {
-            "docs": "/docs" if settings.DEBUG else "disabled",
-            "api": "/api/v1"
-        }
-    })
+    return ResponseFormatter.success_response(_ROOT_INFO)
 
 @app.get("/health")
 async def detailed_health_check():
@@ -125,8 +162,12 @@ async def detailed_health_check():
                 )
             )
         
-        # Get detailed health status from AI coordinator
-        health_status = await ai_coordinator.health_check()
+        # Get detailed health status from AI coordinator (memoized for HEALTH_CACHE_TTL)
+        global _last_health
+        checked_at, health_status = _last_health
+        if health_status is None or time.monotonic() - checked_at >= HEALTH_CACHE_TTL:
+            health_status = await ai_coordinator.health_check()
+            _last_health = (time.monotonic(), health_status)
         
         system_health = {
             "api_gateway": "healthy",
@@ -150,7 +191,7 @@ async def detailed_health_check():
                     "environment": settings.ENVIRONMENT,
                     "debug_mode": settings.DEBUG,
                     "max_audio_size": settings.MAX_AUDIO_SIZE,
-                    "supported_audio_formats": settings.SUPPORTED_AUDIO_FORMATS
+                    "supported_audio_formats": sorted(settings.SUPPORTED_AUDIO_FORMATS)
                 }
             })
         )
@@ -166,52 +207,39 @@ async def detailed_health_check():
             )
         )
 
+_API_INFO = {
+    "api_version": "v1",
+    "available_endpoints": {
+        "interview_management": {
+            "start": "POST /api/v1/interview/start",
+            "status": "GET /api/v1/interview/{session_id}/status",
+            "current_question": "GET /api/v1/interview/{session_id}/question",
+            "complete": "GET /api/v1/interview/{session_id}/complete"
+        },
+        "interaction": {
+            "transcribe": "POST /api/v1/interview/{session_id}/transcribe",
+            "submit_answer": "POST /api/v1/interview/{session_id}/submit-answer",
+            "generate_followup": "POST /api/v1/interview/{session_id}/generate-followup",
+            "next_question": "POST /api/v1/interview/{session_id}/next-question"
+        },
+        "system": {
+            "health": "GET /api/v1/health",
+            "root": "GET /"
+        }
+    },
+    "supported_features": [
+        "Speech-to-text transcription",
+        "AI-powered response analysis",
+        "Contextual follow-up generation", 
+        "Multi-style interview support",
+        "Real-time session management"
+    ]
+}
+
 @app.get("/api/v1")
 async def api_info():
     """API information endpoint"""
-    return ResponseFormatter.success_response({
-        "api_version": "v1",
-        "available_endpoints": {
-            "interview_management": {
-                "start": "POST /api/v1/interview/start",
-                "status": "GET /api/v1/interview/{session_id}/status",
-                "current_question": "GET /api/v1/interview/{session_id}/question",
-                "complete": "GET /api/v1/interview/{session_id}/complete"
-            },
-            "interaction": {
-                "transcribe": "POST /api/v1/interview/{session_id}/transcribe",
-                "submit_answer": "POST /api/v1/interview/{session_id}/submit-answer",
-                "generate_followup": "POST /api/v1/interview/{session_id}/generate-followup",
-                "next_question": "POST /api/v1/interview/{session_id}/next-question"
-            },
-            "system": {
-                "health": "GET /api/v1/health",
-                "root": "GET /"
-            }
-        },
-        "supported_features": [
-            "Speech-to-text transcription",
-            "AI-powered response analysis",
-            "Contextual follow-up generation", 
-            "Multi-style interview support",
-            "Real-time session management"
-        ]
-    })
-
-# Global exception handler
-@app.exception_handler(Exception)
-async def global_exception_handler(request, exc):
-    """Global exception handler"""
-    logger.error(f"Unhandled exception: {exc}", exc_info=True)
-    
-    return JSONResponse(
-        status_code=500,
-        content=ResponseFormatter.error_response(
-            "Internal server error",
-            code=500,
-            details="An unexpected error occurred" if not settings.DEBUG else str(exc)
-        )
-    )
+    return ResponseFormatter.success_response(_API_INFO)
 
 # Development server
 if __name__ == "__main__":
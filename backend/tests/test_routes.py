@@ -0,0 +1,59 @@
+"""
+Tests for ETag revalidation on the polled interview endpoints
+"""
+
+import httpx
+import pytest
+import pytest_asyncio
+from fastapi import FastAPI, HTTPException
+
+from api_gateway.routes import router, http_exception_handler
+
+
+@pytest_asyncio.fixture
+async def client():
+    app = FastAPI()
+    app.include_router(router, prefix="/api")
+    app.add_exception_handler(HTTPException, http_exception_handler)
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        yield client
+
+
+async def _start_session(client: httpx.AsyncClient) -> str:
+    response = await client.post("/api/interview/start", json={})
+    assert response.status_code == 200
+    return response.json()["session_id"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("view", ["status", "question"])
+async def test_unchanged_session_returns_304(client, view):
+    session_id = await _start_session(client)
+
+    first = await client.get(f"/api/interview/{session_id}/{view}")
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+
+    repeat = await client.get(f"/api/interview/{session_id}/{view}", headers={"If-None-Match": etag})
+    assert repeat.status_code == 304
+    assert repeat.headers["etag"] == etag
+    assert repeat.content == b""
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("view", ["status", "question"])
+async def test_progress_changes_etag(client, view):
+    session_id = await _start_session(client)
+    etag = (await client.get(f"/api/interview/{session_id}/{view}")).headers["etag"]
+
+    assert (await client.post(f"/api/interview/{session_id}/next-question")).status_code == 200
+
+    response = await client.get(f"/api/interview/{session_id}/{view}", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+
+
+@pytest.mark.asyncio
+async def test_unknown_session_is_404_not_304(client):
+    response = await client.get("/api/interview/missing/status", headers={"If-None-Match": '"0-0-0-0"'})
+    assert response.status_code == 404
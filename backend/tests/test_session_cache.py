@@ -0,0 +1,132 @@
+"""
+Tests for interview session serialization and the in-process session cache
+"""
+
+import json
+
+import pytest
+
+import core.session_cache as session_cache_module
+from core.session_cache import InMemoryLRU
+from core.utils import InterviewSession, RECENT_AI_INTERACTIONS
+
+
+class FakeClock:
+    """Stand-in for the time module so TTL expiry doesn't need real sleeps"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+def _populated_session() -> InterviewSession:
+    session = InterviewSession("session-1")
+    session.add_response(question_id=1, question="Introduce yourself", answer="I build backends", input_type="audio")
+    session.set_last_followup("Which backend are you proudest of?")
+    session.add_response(question_id=2, question="Recent achievement", answer="Shipped the v2 API")
+    session.add_ai_interaction(
+        input_type="text",
+        user_input="Shipped the v2 API",
+        ai_response="What was the hardest part?",
+        processing_time=0.42,
+        strategy_used="deep_dive",
+        transcription_info={"confidence": 0.9}
+    )
+    session.next_question()
+    session.interview_style = "casual"
+    session.update_metadata("source", "test")
+    session.role = "backend engineer"
+    return session
+
+
+def test_session_round_trips_through_json():
+    session = _populated_session()
+
+    # Same path as the Redis backend: to_dict -> JSON -> from_dict
+    restored = InterviewSession.from_dict(json.loads(json.dumps(session.to_dict(), default=str)))
+
+    assert restored.to_dict() == session.to_dict()
+    assert restored.response_count == 2
+    assert restored.followup_count == 1
+    assert restored.followups == ["Which backend are you proudest of?", None]
+    assert restored.input_types == ["audio", "text"]
+    assert restored.ai_interaction_count == 1
+    assert restored.ai_interactions[0].strategy_used == "deep_dive"
+    assert restored.ai_interactions[0].transcription_info == {"confidence": 0.9}
+    assert restored.get_context() == session.get_context()
+
+
+def test_restored_session_duration_follows_created_at():
+    session = _populated_session()
+    data = session.to_dict()
+    data["created_at"] = "2020-01-01T00:00:00+00:00"
+
+    restored = InterviewSession.from_dict(data)
+
+    # Re-anchored from the wall-clock age, not the other process's monotonic clock
+    assert restored.duration().days > 365
+
+
+def test_session_keeps_bounded_ai_history():
+    session = InterviewSession("session-1")
+    for i in range(RECENT_AI_INTERACTIONS + 4):
+        session.add_ai_interaction(input_type="text", user_input=f"q{i}", ai_response=f"a{i}", processing_time=0.0)
+
+    restored = InterviewSession.from_dict(session.to_dict())
+
+    assert len(restored.ai_interactions) == RECENT_AI_INTERACTIONS
+    assert restored.ai_interaction_count == RECENT_AI_INTERACTIONS + 4
+    assert restored.ai_interactions[-1].user_input == f"q{RECENT_AI_INTERACTIONS + 3}"
+
+
+@pytest.mark.asyncio
+async def test_lru_evicts_least_recently_used():
+    cache = InMemoryLRU(max=2, ttl=60)
+    await cache.set("a", InterviewSession("a"))
+    await cache.set("b", InterviewSession("b"))
+
+    # Reading "a" makes "b" the least recently used
+    assert await cache.get("a") is not None
+    await cache.set("c", InterviewSession("c"))
+
+    assert len(cache) == 2
+    assert await cache.get("b") is None
+    assert (await cache.get("a")).session_id == "a"
+    assert (await cache.get("c")).session_id == "c"
+
+
+@pytest.mark.asyncio
+async def test_lru_expires_idle_sessions(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(session_cache_module, "time", clock)
+    cache = InMemoryLRU(max=10, ttl=60)
+    await cache.set("a", InterviewSession("a"))
+    await cache.set("b", InterviewSession("b"))
+
+    clock.now += 50
+    await cache.touch("a")  # Sliding TTL: "a" now lives until +110
+    clock.now += 20
+
+    assert await cache.get("b") is None
+    assert len(cache) == 1
+    assert (await cache.get("a")).session_id == "a"
+
+    clock.now += 45
+    assert await cache.get("a") is None
+    assert len(cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_update_writes_session_back_and_skips_missing():
+    cache = InMemoryLRU(max=10, ttl=60)
+    await cache.set("a", InterviewSession("a"))
+
+    async with cache.update("a") as session:
+        session.next_question()
+    async with cache.update("missing") as session:
+        assert session is None
+
+    assert (await cache.get("a")).current_question_index == 1
+    assert await cache.get("missing") is None